@@ -53,6 +53,20 @@ class ListingView(HomeAssistantView):
         return json.dumps(self._hass.data[DOMAIN][ICONS])
 
 
+def _list_icons(iconpath: str) -> list[dict[str, str]]:
+    """Walk the icon directory and list the available icons."""
+    icons = []
+    for dirpath, _dirnames, filenames in walk(iconpath):
+        icons.extend(
+            [
+                {"name": path.join(dirpath[len(iconpath) :], fn[:-4])}
+                for fn in filenames
+                if fn.endswith(".svg")
+            ]
+        )
+    return icons
+
+
 async def async_setup(hass: HomeAssistant, config) -> bool:
     """Set up the icons for the Philips AirPurifier integration."""
     _LOGGER.debug("async_setup called")
@@ -63,16 +77,8 @@ async def async_setup(hass: HomeAssistant, config) -> bool:
     iset = PAP
     iconpath = hass.config.path(ICONS_PATH + "/" + iset)
 
-    # walk the directory to get the icons
-    icons = []
-    for dirpath, _dirnames, filenames in walk(iconpath):
-        icons.extend(
-            [
-                {"name": path.join(dirpath[len(iconpath) :], fn[:-4])}
-                for fn in filenames
-                if fn.endswith(".svg")
-            ]
-        )
+    # walk the directory to get the icons, without blocking the event loop
+    icons = await hass.async_add_executor_job(_list_icons, iconpath)
 
     # store icons
     data = hass.data.get(DOMAIN)
@@ -109,7 +115,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if data is None:
         hass.data[DOMAIN] = {}
 
-    hass.data[DOMAIN][host] = {
+    # stored per entry, as the host of an entry changes when a device gets a new address
+    hass.data[DOMAIN][entry.entry_id] = {
         DATA_KEY_CLIENT: client,
         DATA_KEY_COORDINATOR: coordinator,
     }
@@ -131,9 +138,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     for p in PLATFORMS:
         await hass.config_entries.async_forward_entry_unload(entry, p)
 
-    coord: Coordinator = hass.data[DOMAIN][entry.data[CONF_HOST]][DATA_KEY_COORDINATOR]
+    coord: Coordinator = hass.data[DOMAIN][entry.entry_id][DATA_KEY_COORDINATOR]
     await coord.shutdown()
 
-    hass.data[DOMAIN].pop(entry.data[CONF_HOST])
+    hass.data[DOMAIN].pop(entry.entry_id)
 
     return True
@@ -1,8 +1,10 @@
 """The Philips AirPurifier component."""
 import asyncio
+from dataclasses import dataclass
 import ipaddress
 import logging
 import re
+import time
 from typing import Any
 
 from aioairctrl import CoAPClient
@@ -13,23 +15,44 @@ from homeassistant.components import dhcp
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
-from homeassistant.util.timeout import TimeoutManager
 
 from .const import CONF_DEVICE_ID, CONF_MODEL, DOMAIN, PhilipsApi
 from .philips import model_to_class
 
 _LOGGER = logging.getLogger(__name__)
 
+# limit the number of devices probed in parallel when many are discovered at once
+_DISCOVERY_SEMAPHORE = asyncio.Semaphore(8)
+
+# how long the result of a DHCP probe is remembered, in seconds
+PROBE_CACHE_TTL_SECONDS = 300
+
+
+# the user form only ever asks for the host, the entered value is filled in as suggestion
+_USER_SCHEMA = vol.Schema({vol.Required(CONF_HOST): cv.string})
+
+_HOST_DISALLOWED = re.compile(r"[^a-zA-Z\d\-]")
+
 
 def host_valid(host: str) -> bool:
     """Return True if hostname or IP address is valid."""
     try:
-        if ipaddress.ip_address(host).version in [4, 6]:
-            return True
+        ipaddress.ip_address(host)
+        return True
     except ValueError:
         pass
-    disallowed = re.compile(r"[^a-zA-Z\d\-]")
-    return all(x and not disallowed.search(x) for x in host.split("."))
+    search = _HOST_DISALLOWED.search
+    return not any(not x or search(x) for x in host.split("."))
+
+
+@dataclass(slots=True)
+class _ProbeResult:
+    """Device data detected when probing a host."""
+
+    host: str
+    model: str
+    name: str
+    device_id: str
 
 
 class PhilipsAirPurifierConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -37,107 +60,70 @@ class PhilipsAirPurifierConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    # probe result (or None for unsupported devices) and time of the last probe per host,
+    # shared between flows to avoid probing the same host on every DHCP event
+    _probe_cache: dict[str, tuple[_ProbeResult | None, float]] = {}
+
     def __init__(self) -> None:
         """Initialize."""
-        self._host: str = None
-        self._model: Any = None
-        self._name: Any = None
-        self._device_id: str = None
+        self._probe: _ProbeResult | None = None
 
     def _get_schema(self, user_input):
         """Provide schema for user input."""
-        schema = vol.Schema(
-            {vol.Required(CONF_HOST, default=user_input.get(CONF_HOST, "")): cv.string}
+        return self.add_suggested_values_to_schema(
+            _USER_SCHEMA, {CONF_HOST: user_input.get(CONF_HOST, "")}
         )
-        return schema
 
     async def async_step_dhcp(self, discovery_info: dhcp.DhcpServiceInfo) -> FlowResult:
         """Handle initial step of auto discovery flow."""
         _LOGGER.debug("async_step_dhcp: called, found: %s", discovery_info)
 
-        self._host = discovery_info.ip
-        _LOGGER.debug("trying to configure host: %s", self._host)
-
-        # let's try and connect to an AirPurifier
-        try:
-            client = None
-            timeout = TimeoutManager()
-
-            # try for 30s to get a valid client
-            async with timeout.async_timeout(30):
-                client = await CoAPClient.create(self._host)
-                _LOGGER.debug("got a valid client for host %s", self._host)
+        host = discovery_info.ip
 
-            # we give it 30s to get a status, otherwise we abort
-            async with timeout.async_timeout(30):
-                _LOGGER.debug("trying to get status")
-                status, _ = await client.get_status()
-                _LOGGER.debug("got status")
+        # a device that is already configured under this address doesn't need to be probed
+        self._async_abort_entries_match({CONF_HOST: host})
 
-            if client is not None:
-                await client.shutdown()
+        # a recently probed host is either unsupported or might already be configured
+        cached = self._get_cached_probe(host)
+        if cached is not None:
+            if cached[0] is None:
+                return self.async_abort(reason="model_unsupported")
+            await self.async_set_unique_id(cached[0].device_id)
+            self._abort_if_unique_id_configured(updates={CONF_HOST: host})
 
-            # get the status out of the queue
-            _LOGGER.debug("status for host %s is: %s", self._host, status)
+        _LOGGER.debug("trying to configure host: %s", host)
 
-        except asyncio.TimeoutError:
-            _LOGGER.warning(
-                r"Timeout, host %s looks like a Philips AirPurifier but doesn't answer, aborting",
-                self._host,
-            )
+        # let's try and connect to an AirPurifier
+        status, error = await self._async_probe_host(host, discovered=True)
+        if error == "timeout":
             return self.async_abort(reason="model_unsupported")
-
-        except Exception as ex:
-            _LOGGER.warning(r"Failed to connect: %s", ex)
-            raise exceptions.ConfigEntryNotReady from ex
+        if error is not None:
+            return self.async_abort(reason="cannot_connect")
 
         # autodetect model and name
-        self._model = list(
-            filter(
-                None, map(status.get, [PhilipsApi.MODEL_ID, PhilipsApi.NEW_MODEL_ID])
-            )
-        )[0][:9]
-        self._name = list(
-            filter(None, map(status.get, [PhilipsApi.NAME, PhilipsApi.NEW_NAME]))
-        )[0]
-        self._device_id = status[PhilipsApi.DEVICE_ID]
-        _LOGGER.debug(
-            "Detected host %s as model %s with name: %s",
-            self._host,
-            self._model,
-            self._name,
-        )
+        model, name, device_id = self._identify_device(host, status)
 
         # check if model is supported
-        if self._model not in model_to_class:
-            _LOGGER.info(
-                "Model %s found, but not supported directly. Trying model family",
-                self._model,
-            )
-            self._model = self._model[:6]
-            if self._model not in model_to_class:
-                _LOGGER.warning(
-                    "Model %s found, but not supported. Aborting discovery",
-                    self._model,
-                )
-                return self.async_abort(reason="model_unsupported")
+        if model is None:
+            self._cache_probe(host, None)
+            return self.async_abort(reason="model_unsupported")
+
+        probe = _ProbeResult(host, model, name, device_id)
+        self._cache_probe(host, probe)
 
         # use the device ID as unique_id
-        unique_id = self._device_id
+        unique_id = device_id
         _LOGGER.debug("async_step_user: unique_id=%s", unique_id)
 
         # set the unique id for the entry, abort if it already exists
+        # but make sure a changed address of a known device is picked up
         await self.async_set_unique_id(unique_id)
-        self._abort_if_unique_id_configured()
+        self._abort_if_unique_id_configured(updates={CONF_HOST: host})
 
         # store the data for the next step to get confirmation
-        self.context.update(
-            {
-                "title_placeholders": {
-                    CONF_NAME: self._model + " " + self._name,
-                }
-            }
-        )
+        self._probe = probe
+        title = f"{model} {name}"
+        self.context.update({"title_placeholders": {CONF_NAME: title}})
 
         # show the confirmation form to the user
         _LOGGER.debug("waiting for async_step_confirm")
@@ -146,30 +132,30 @@ class PhilipsAirPurifierConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_confirm(self, user_input: dict[str, Any] = None) -> FlowResult:
         """Confirm the dhcp discovered data."""
         _LOGGER.debug("async_step_confirm called with user_input: %s", user_input)
+        probe = self._probe
 
         # user input was provided, so check and save it
         if user_input is not None:
             _LOGGER.debug(
                 "entered creation for model %s with name '%s' at %s",
-                self._model,
-                self._name,
-                self._host,
+                probe.model,
+                probe.name,
+                probe.host,
             )
-            user_input[CONF_MODEL] = self._model
-            user_input[CONF_NAME] = self._name
-            user_input[CONF_DEVICE_ID] = self._device_id
-            user_input[CONF_HOST] = self._host
+            user_input[CONF_MODEL] = probe.model
+            user_input[CONF_NAME] = probe.name
+            user_input[CONF_DEVICE_ID] = probe.device_id
+            user_input[CONF_HOST] = probe.host
 
-            return self.async_create_entry(
-                title=self._model + " " + self._name, data=user_input
-            )
+            title = f"{probe.model} {probe.name}"
+            return self.async_create_entry(title=title, data=user_input)
 
         _LOGGER.debug("showing confirmation form")
         # show the form to the user
         self._set_confirm_only()
         return self.async_show_form(
             step_id="confirm",
-            description_placeholders={"model": self._model, "name": self._name},
+            description_placeholders={"model": probe.model, "name": probe.name},
         )
 
     async def async_step_user(self, user_input: dict[str, Any] = None) -> FlowResult:
@@ -183,73 +169,44 @@ class PhilipsAirPurifierConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # first some sanitycheck on the host input
                 if not host_valid(user_input[CONF_HOST]):
                     raise InvalidHost()
-                self._host = user_input[CONF_HOST]
-                _LOGGER.debug("trying to configure host: %s", self._host)
-
-                # let's try and connect to an AirPurifier
-                try:
-                    client = None
-                    timeout = TimeoutManager()
-
-                    # try for 30s to get a valid client
-                    async with timeout.async_timeout(30):
-                        client = await CoAPClient.create(self._host)
-                        _LOGGER.debug("got a valid client")
-
-                    # we give it 30s to get a status, otherwise we abort
-                    async with timeout.async_timeout(30):
-                        _LOGGER.debug("trying to get status")
-                        status, _ = await client.get_status()
-                        _LOGGER.debug("got status")
-
-                    if client is not None:
-                        await client.shutdown()
-
-                except asyncio.TimeoutError:
-                    _LOGGER.warning(
-                        r"Timeout, host %s doesn't answer, aborting", self._host
-                    )
-                    return self.async_abort(reason="timeout")
-
-                except Exception as ex:
-                    _LOGGER.warning(r"Failed to connect: %s", ex)
-                    raise exceptions.ConfigEntryNotReady from ex
-
-                # autodetect model and name
-                self._model = list(
-                    filter(
-                        None,
-                        map(status.get, [PhilipsApi.MODEL_ID, PhilipsApi.NEW_MODEL_ID]),
-                    )
-                )[0][:9]
-                self._name = list(
-                    filter(
-                        None, map(status.get, [PhilipsApi.NAME, PhilipsApi.NEW_NAME])
-                    )
-                )[0]
-                self._device_id = status[PhilipsApi.DEVICE_ID]
-                user_input[CONF_MODEL] = self._model
-                user_input[CONF_NAME] = self._name
-                user_input[CONF_DEVICE_ID] = self._device_id
-                _LOGGER.debug(
-                    "Detected host %s as model %s with name: %s",
-                    self._host,
-                    self._model,
-                    self._name,
-                )
-
-                # check if model is supported
-                if self._model not in model_to_class:
-                    _LOGGER.info(
-                        "Model %s not supported. Trying model family", self._model
-                    )
-                    self._model = self._model[:6]
-                    if self._model not in model_to_class:
+                host = user_input[CONF_HOST]
+                _LOGGER.debug("trying to configure host: %s", host)
+
+                # a device that is already configured under this address doesn't need to be probed
+                self._async_abort_entries_match({CONF_HOST: host})
+
+                # a recent probe of this host already tells us what it is
+                cached = self._get_cached_probe(host)
+                if cached is not None:
+                    probe = cached[0]
+                    if probe is None:
+                        return self.async_abort(reason="model_unsupported")
+
+                else:
+                    # let's try and connect to an AirPurifier
+                    status, error = await self._async_probe_host(host, discovered=False)
+                    if error == "timeout":
+                        return self.async_abort(reason="timeout")
+                    if error is not None:
+                        errors[CONF_HOST] = error
+                        return self._async_show_user_form(user_input, errors)
+
+                    # autodetect model and name
+                    model, name, device_id = self._identify_device(host, status)
+
+                    # check if model is supported
+                    if model is None:
+                        self._cache_probe(host, None)
                         return self.async_abort(reason="model_unsupported")
-                    user_input[CONF_MODEL] = self._model
+                    probe = _ProbeResult(host, model, name, device_id)
+                    self._cache_probe(host, probe)
+
+                user_input[CONF_MODEL] = probe.model
+                user_input[CONF_NAME] = probe.name
+                user_input[CONF_DEVICE_ID] = probe.device_id
 
                 # use the device ID as unique_id
-                unique_id = self._device_id
+                unique_id = probe.device_id
                 _LOGGER.debug("async_step_user: unique_id=%s", unique_id)
 
                 # set the unique id for the entry, abort if it already exists
@@ -257,25 +214,117 @@ class PhilipsAirPurifierConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._abort_if_unique_id_configured()
 
                 # compile a name and return the config entry
-                return self.async_create_entry(
-                    title=self._model + " " + self._name, data=user_input
-                )
+                title = f"{probe.model} {probe.name}"
+                return self.async_create_entry(title=title, data=user_input)
 
             except InvalidHost:
                 errors[CONF_HOST] = "host"
-            except exceptions.ConfigEntryNotReady:
-                errors[CONF_HOST] = "connect"
 
-        if user_input is None:
-            user_input = {}
-
-        # no user_input so far
-        # what to ask the user
+        return self._async_show_user_form(user_input or {}, errors)
+
+    def _get_cached_probe(
+        self, host: str
+    ) -> tuple[_ProbeResult | None, float] | None:
+        """Return the cached probe of a host if it is recent enough."""
+        cached = self._probe_cache.get(host)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[1] >= PROBE_CACHE_TTL_SECONDS:
+            del self._probe_cache[host]
+            return None
+        return cached
+
+    def _cache_probe(self, host: str, probe: _ProbeResult | None) -> None:
+        """Remember the probe of a host, dropping the expired probes of other hosts."""
+        now = time.monotonic()
+        cache = self._probe_cache
+        for expired in [
+            key
+            for key, (_, probed) in cache.items()
+            if now - probed >= PROBE_CACHE_TTL_SECONDS
+        ]:
+            del cache[expired]
+        cache[host] = (probe, now)
+
+    def _async_show_user_form(
+        self, user_input: dict[str, Any], errors: dict[str, str]
+    ) -> FlowResult:
+        """Show the form asking the user for the host."""
         schema = self._get_schema(user_input)
-
-        # show the form to the user
         return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
+    async def _async_probe_host(
+        self, host: str, discovered: bool
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """Fetch the status of a host, returning the status or an error reason."""
+        if not discovered:
+            return await self._async_fetch_status(host)
+        async with _DISCOVERY_SEMAPHORE:
+            return await self._async_fetch_status(host)
+
+    async def _async_fetch_status(
+        self, host: str
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """Connect to a host and get its status."""
+        client = None
+        try:
+            # try for 30s to get a valid client
+            client = await asyncio.wait_for(CoAPClient.create(host), timeout=30)
+            _LOGGER.debug("got a valid client for host %s", host)
+
+            # we give it 30s to get a status, otherwise we abort
+            _LOGGER.debug("trying to get status")
+            status, _ = await asyncio.wait_for(client.get_status(), timeout=30)
+            _LOGGER.debug("status for host %s is: %s", host, status)
+
+        except asyncio.TimeoutError:
+            _LOGGER.warning(r"Timeout, host %s doesn't answer, aborting", host)
+            return None, "timeout"
+
+        except Exception as ex:
+            _LOGGER.warning(r"Failed to connect to host %s: %s", host, ex)
+            return None, "connect"
+
+        finally:
+            # the status is all we need, so don't hold up the flow on the teardown
+            if client is not None:
+                self.hass.async_create_task(client.shutdown())
+
+        return status, None
+
+    @staticmethod
+    def _identify_device(
+        host: str, status: dict[str, Any]
+    ) -> tuple[str | None, str | None, str]:
+        """Detect model, name and device ID, with model None if it isn't supported."""
+        # older devices report name and model under the old keys, newer under the new
+        model = status.get(PhilipsApi.MODEL_ID) or status.get(PhilipsApi.NEW_MODEL_ID)
+        name = status.get(PhilipsApi.NAME) or status.get(PhilipsApi.NEW_NAME)
+        device_id = status[PhilipsApi.DEVICE_ID]
+        if not model or not name:
+            _LOGGER.warning("Host %s reports no model or name", host)
+            return None, name, device_id
+        model = model[:9]
+        _LOGGER.debug(
+            "Detected host %s as model %s with name: %s",
+            host,
+            model,
+            name,
+        )
+
+        # check if model is supported
+        if model not in model_to_class:
+            _LOGGER.info(
+                "Model %s found, but not supported directly. Trying model family",
+                model,
+            )
+            model = model[:6]
+            if model not in model_to_class:
+                _LOGGER.warning("Model %s found, but not supported", model)
+                return None, name, device_id
+
+        return model, name, device_id
+
 
 class InvalidHost(exceptions.HomeAssistantError):
     """Error to indicate that hostname/IP address is invalid."""
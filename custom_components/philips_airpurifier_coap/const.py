@@ -1,28 +1,24 @@
 """Constants for Philips AirPurifier integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from enum import StrEnum
+import sys
+from types import MappingProxyType
 
-from homeassistant.components.sensor import (
-    ATTR_STATE_CLASS,
-    SensorDeviceClass,
-    SensorStateClass,
-)
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
-    ATTR_ICON,
     ATTR_TEMPERATURE,
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-    CONF_ENTITY_CATEGORY,
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     UnitOfTemperature,
-    UnitOfTime,
 )
 from homeassistant.helpers.entity import EntityCategory
 
 from .model import (
     FilterDescription,
+    LabeledIcon,
     LightDescription,
     SelectDescription,
     SensorDescription,
@@ -81,8 +77,6 @@ CONF_DEVICE_ID = "device_id"
 
 SWITCH_ON = "on"
 SWITCH_OFF = "off"
-OPTIONS = "options"
-DIMMABLE = "dimmable"
 
 
 class FanModel(StrEnum):
@@ -134,25 +128,27 @@ class PresetMode:
     GAS = "gas"
     POLLUTION = "pollution"
 
-    ICON_MAP = {
-        ALLERGEN: ICON.ALLERGEN_MODE,
-        AUTO: ICON.AUTO_MODE,
-        AUTO_GENERAL: ICON.AUTO_MODE,
-        BACTERIA: ICON.BACTERIA_VIRUS_MODE,
-        SPEED_GENTLE_1: ICON.SPEED_1,
-        SPEED_1: ICON.SPEED_1,
-        SPEED_2: ICON.SPEED_2,
-        SPEED_3: ICON.SPEED_3,
-        # we use the sleep mode icon for all related modes
-        GENTLE: ICON.SLEEP_MODE,
-        NIGHT: ICON.SLEEP_MODE,
-        SLEEP: ICON.SLEEP_MODE,
-        # unfortunately, the allergy sleep mode has the same icon as the auto mode on the device
-        SLEEP_ALLERGY: ICON.AUTO_MODE,
-        # some devices have a gas and a pollution mode, but there doesn't seem to be a Philips icon for that
-        POLLUTION: ICON.AUTO_MODE,
-        GAS: ICON.AUTO_MODE,
-    }
+    ICON_MAP = MappingProxyType(
+        {
+            ALLERGEN: ICON.ALLERGEN_MODE,
+            AUTO: ICON.AUTO_MODE,
+            AUTO_GENERAL: ICON.AUTO_MODE,
+            BACTERIA: ICON.BACTERIA_VIRUS_MODE,
+            SPEED_GENTLE_1: ICON.SPEED_1,
+            SPEED_1: ICON.SPEED_1,
+            SPEED_2: ICON.SPEED_2,
+            SPEED_3: ICON.SPEED_3,
+            # we use the sleep mode icon for all related modes
+            GENTLE: ICON.SLEEP_MODE,
+            NIGHT: ICON.SLEEP_MODE,
+            SLEEP: ICON.SLEEP_MODE,
+            # unfortunately, the allergy sleep mode has the same icon as the auto mode on the device
+            SLEEP_ALLERGY: ICON.AUTO_MODE,
+            # some devices have a gas and a pollution mode, but there doesn't seem to be a Philips icon for that
+            POLLUTION: ICON.AUTO_MODE,
+            GAS: ICON.AUTO_MODE,
+        }
+    )
 
 
 class FanFunction(StrEnum):
@@ -198,9 +194,6 @@ class FanAttributes(StrEnum):
     HUMIDITY = "humidity"
     HUMIDITY_TARGET = "humidity_target"
     INDOOR_ALLERGEN_INDEX = "indoor_allergen_index"
-    LABEL = "label"
-    UNIT = "unit"
-    VALUE = "value"
     LANGUAGE = "language"
     LIGHT_BRIGHTNESS = "light_brightness"
     MODE = "mode"
@@ -217,9 +210,6 @@ class FanAttributes(StrEnum):
     WIFI_VERSION = "wifi_version"
     PREFIX = "prefix"
     POSTFIX = "postfix"
-    ICON_MAP = "icon_map"
-    WARN_VALUE = "warn_value"
-    WARN_ICON = "warn_icon"
     RSSI = "rssi"
 
 
@@ -289,10 +279,12 @@ class PhilipsApi:
     WIFI_VERSION = "WifiVersion"
     RSSI = "rssi"
 
-    POWER_MAP = {
-        SWITCH_ON: "1",
-        SWITCH_OFF: "0",
-    }
+    POWER_MAP = MappingProxyType(
+        {
+            SWITCH_ON: "1",
+            SWITCH_OFF: "0",
+        }
+    )
     # the AC1715 seems to follow a new scheme, this should later be refactored
     NEW_NAME = "D01-03"
     NEW_MODEL_ID = "D01-05"
@@ -304,239 +296,285 @@ class PhilipsApi:
     NEW_PM25 = "D03-33"
     NEW_PREFERRED_INDEX = "D03-42"
 
-    PREFERRED_INDEX_MAP = {
-        "0": ("Indoor Allergen Index", ICON.IAI),
-        "1": ("PM2.5", ICON.PM25),
-    }
-    GAS_PREFERRED_INDEX_MAP = {
-        "0": ("Indoor Allergen Index", ICON.IAI),
-        "1": ("PM2.5", ICON.PM25),
-        "2": ("Gas", "mdi:air"),
-    }
-    NEW_PREFERRED_INDEX_MAP = {
-        "IAI": ("Indoor Allergen Index", ICON.IAI),
-        "PM2.5": ("PM2.5", ICON.PM25),
-    }
-    FUNCTION_MAP = {
-        "P": ("Purification", ICON.PURIFICATION_ONLY_MODE),
-        "PH": ("Purification and Humidification", ICON.TWO_IN_ONE_MODE),
+    PREFERRED_INDEX_MAP = MappingProxyType(
+        {
+            "0": LabeledIcon("Indoor Allergen Index", ICON.IAI),
+            "1": LabeledIcon("PM2.5", ICON.PM25),
+        }
+    )
+    GAS_PREFERRED_INDEX_MAP = MappingProxyType(
+        {
+            "0": LabeledIcon("Indoor Allergen Index", ICON.IAI),
+            "1": LabeledIcon("PM2.5", ICON.PM25),
+            "2": LabeledIcon("Gas", "mdi:air"),
+        }
+    )
+    NEW_PREFERRED_INDEX_MAP = MappingProxyType(
+        {
+            "IAI": LabeledIcon("Indoor Allergen Index", ICON.IAI),
+            "PM2.5": LabeledIcon("PM2.5", ICON.PM25),
+        }
+    )
+    FUNCTION_MAP = MappingProxyType(
+        {
+            "P": LabeledIcon("Purification", ICON.PURIFICATION_ONLY_MODE),
+            "PH": LabeledIcon("Purification and Humidification", ICON.TWO_IN_ONE_MODE),
+        }
+    )
+    HUMIDITY_TARGET_MAP = MappingProxyType(
+        {
+            40: LabeledIcon("40%", ICON.HUMIDITY_BUTTON),
+            50: LabeledIcon("50%", ICON.HUMIDITY_BUTTON),
+            60: LabeledIcon("60%", ICON.HUMIDITY_BUTTON),
+            70: LabeledIcon("max", ICON.HUMIDITY_BUTTON),
+        }
+    )
+    ERROR_CODE_MAP = MappingProxyType(
+        {
+            32768: "no water",
+            49153: "pre-filter must be cleaned",
+            49155: "pre-filter must be cleaned",
+            49408: "no water",
+        }
+    )
+
+
+# the field names are the keys of every status update, so intern them for lookups
+for _key, _value in list(vars(PhilipsApi).items()):
+    if isinstance(_value, str) and not _key.startswith("_"):
+        setattr(PhilipsApi, _key, sys.intern(_value))
+del _key, _value
+
+
+# error codes signalling that the water tank is empty
+_NO_WATER_ERRORS = frozenset(
+    code for code, error in PhilipsApi.ERROR_CODE_MAP.items() if error == "no water"
+)
+
+
+def _water_level(value, status):
+    """Report an empty water tank while the device signals that water is missing."""
+    return 0 if status.get(PhilipsApi.ERROR_CODE) in _NO_WATER_ERRORS else value
+
+
+SENSOR_TYPES: Mapping[str, SensorDescription] = MappingProxyType(
+    {
+        # device sensors
+        PhilipsApi.AIR_QUALITY_INDEX: SensorDescription(
+            device_class=SensorDeviceClass.AQI,
+            icon_map={0: "mdi:blur"},
+            label=FanAttributes.AIR_QUALITY_INDEX,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        PhilipsApi.INDOOR_ALLERGEN_INDEX: SensorDescription(
+            icon_map={0: ICON.IAI},
+            label=FanAttributes.INDOOR_ALLERGEN_INDEX,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        PhilipsApi.NEW_INDOOR_ALLERGEN_INDEX: SensorDescription(
+            icon_map={0: ICON.IAI},
+            label=FanAttributes.INDOOR_ALLERGEN_INDEX,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        PhilipsApi.PM25: SensorDescription(
+            device_class=SensorDeviceClass.PM25,
+            icon_map={0: ICON.PM25},
+            label=FanAttributes.PM25,
+            unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        PhilipsApi.NEW_PM25: SensorDescription(
+            device_class=SensorDeviceClass.PM25,
+            icon_map={0: ICON.PM25},
+            label=FanAttributes.PM25,
+            unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        PhilipsApi.TOTAL_VOLATILE_ORGANIC_COMPOUNDS: SensorDescription(
+            device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
+            icon_map={0: "mdi:blur"},
+            label=FanAttributes.TOTAL_VOLATILE_ORGANIC_COMPOUNDS,
+            unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        PhilipsApi.HUMIDITY: SensorDescription(
+            device_class=SensorDeviceClass.HUMIDITY,
+            icon_map={0: "mdi:water-percent"},
+            label=FanAttributes.HUMIDITY,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit=PERCENTAGE,
+        ),
+        PhilipsApi.TEMPERATURE: SensorDescription(
+            device_class=SensorDeviceClass.TEMPERATURE,
+            icon_map={
+                0: "mdi:thermometer-low",
+                17: "mdi:thermometer",
+                23: "mdi:thermometer-high",
+            },
+            label=ATTR_TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit=UnitOfTemperature.CELSIUS,
+        ),
+        # diagnostic information
+        PhilipsApi.WATER_LEVEL: SensorDescription(
+            icon_map={0: ICON.WATER_REFILL, 10: "mdi:water"},
+            label=FanAttributes.WATER_LEVEL,
+            value=_water_level,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit=PERCENTAGE,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        PhilipsApi.RSSI: SensorDescription(
+            icon_map={
+                -150: "mdi:wifi-strength-off-outline",
+                -90: "mdi:wifi-strength-outline",
+                -80: "mdi:wifi-strength-1",
+                -70: "mdi:wifi-strength-2",
+                -67: "mdi:wifi-strength-3",
+                -30: "mdi:wifi-strength-4",
+            },
+            label=FanAttributes.RSSI,
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            unit=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # PhilipsApi.RUNTIME: SensorDescription(
+        #     icon_map={0: "mdi:timer"},
+        #     label=FanAttributes.RUNTIME,
+        #     state_class=SensorStateClass.TOTAL,
+        #     device_class=SensorDeviceClass.DURATION,
+        #     unit=UnitOfTime.MILLISECONDS,
+        #     entity_category=EntityCategory.DIAGNOSTIC,
+        # ),
     }
-    HUMIDITY_TARGET_MAP = {
-        40: ("40%", ICON.HUMIDITY_BUTTON),
-        50: ("50%", ICON.HUMIDITY_BUTTON),
-        60: ("60%", ICON.HUMIDITY_BUTTON),
-        70: ("max", ICON.HUMIDITY_BUTTON),
+)
+
+
+def _filter(
+    label: str,
+    total: str,
+    type_: str,
+    *,
+    icon: str = "mdi:dots-grid",
+    warn_icon: str = ICON.FILTER_REPLACEMENT,
+    warn_value: int = 72,
+) -> FilterDescription:
+    """Describe a filter, showing the warning icon up to the warning value."""
+    return FilterDescription(
+        label=label,
+        total=total,
+        type=type_,
+        icon_map={0: warn_icon, warn_value: icon},
+    )
+
+
+FILTER_TYPES: Mapping[str, FilterDescription] = MappingProxyType(
+    {
+        PhilipsApi.FILTER_PRE: _filter(
+            FanAttributes.FILTER_PRE,
+            PhilipsApi.FILTER_PRE_TOTAL,
+            PhilipsApi.FILTER_PRE_TYPE,
+        ),
+        PhilipsApi.FILTER_HEPA: _filter(
+            FanAttributes.FILTER_HEPA,
+            PhilipsApi.FILTER_HEPA_TOTAL,
+            PhilipsApi.FILTER_HEPA_TYPE,
+        ),
+        PhilipsApi.FILTER_ACTIVE_CARBON: _filter(
+            FanAttributes.FILTER_ACTIVE_CARBON,
+            PhilipsApi.FILTER_ACTIVE_CARBON_TOTAL,
+            PhilipsApi.FILTER_ACTIVE_CARBON_TYPE,
+        ),
+        PhilipsApi.FILTER_WICK: _filter(
+            FanAttributes.FILTER_WICK,
+            PhilipsApi.FILTER_WICK_TOTAL,
+            PhilipsApi.FILTER_WICK_TYPE,
+            warn_icon=ICON.PREFILTER_WICK_CLEANING,
+        ),
+        PhilipsApi.FILTER_NANOPROTECT: _filter(
+            FanAttributes.FILTER_NANOPROTECT,
+            PhilipsApi.FILTER_NANOPROTECT_TOTAL,
+            PhilipsApi.FILTER_NANOPROTECT_TYPE,
+            icon=ICON.NANOPROTECT_FILTER,
+            warn_value=10,
+        ),
+        PhilipsApi.FILTER_NANOPROTECT_PREFILTER: _filter(
+            FanAttributes.FILTER_NANOPROTECT_CLEAN,
+            PhilipsApi.FILTER_NANOPROTECT_CLEAN_TOTAL,
+            "",
+            icon=ICON.NANOPROTECT_FILTER,
+            warn_icon=ICON.PREFILTER_CLEANING,
+            warn_value=10,
+        ),
     }
-    ERROR_CODE_MAP = {
-        32768: "no water",
-        49153: "pre-filter must be cleaned",
-        49155: "pre-filter must be cleaned",
-        49408: "no water",
+)
+
+SWITCH_TYPES: Mapping[str, SwitchDescription] = MappingProxyType(
+    {
+        PhilipsApi.CHILD_LOCK: SwitchDescription(
+            icon=ICON.CHILD_LOCK_BUTTON,
+            label=FanAttributes.CHILD_LOCK,
+            entity_category=EntityCategory.CONFIG,
+            switch_on=True,
+            switch_off=False,
+        ),
     }
+)
 
+LIGHT_TYPES: Mapping[str, LightDescription] = MappingProxyType(
+    {
+        PhilipsApi.DISPLAY_BACKLIGHT: LightDescription(
+            icon=ICON.LIGHT_DIMMING_BUTTON,
+            label=FanAttributes.DISPLAY_BACKLIGHT,
+            entity_category=EntityCategory.CONFIG,
+            switch_on="1",
+            switch_off="0",
+        ),
+        PhilipsApi.LIGHT_BRIGHTNESS: LightDescription(
+            icon="mdi:circle-outline",
+            label=FanAttributes.LIGHT_BRIGHTNESS,
+            entity_category=EntityCategory.CONFIG,
+            switch_on=100,
+            switch_off=0,
+            dimmable=True,
+        ),
+        PhilipsApi.NEW_DISPLAY_BACKLIGHT: LightDescription(
+            icon=ICON.LIGHT_DIMMING_BUTTON,
+            label=FanAttributes.DISPLAY_BACKLIGHT,
+            entity_category=EntityCategory.CONFIG,
+            switch_on=100,
+            switch_off=0,
+        ),
+    }
+)
 
-SENSOR_TYPES: dict[str, SensorDescription] = {
-    # device sensors
-    PhilipsApi.AIR_QUALITY_INDEX: {
-        ATTR_DEVICE_CLASS: SensorDeviceClass.AQI,
-        FanAttributes.ICON_MAP: {0: "mdi:blur"},
-        FanAttributes.LABEL: FanAttributes.AIR_QUALITY_INDEX,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-    },
-    PhilipsApi.INDOOR_ALLERGEN_INDEX: {
-        FanAttributes.ICON_MAP: {0: ICON.IAI},
-        FanAttributes.LABEL: FanAttributes.INDOOR_ALLERGEN_INDEX,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-    },
-    PhilipsApi.NEW_INDOOR_ALLERGEN_INDEX: {
-        FanAttributes.ICON_MAP: {0: ICON.IAI},
-        FanAttributes.LABEL: FanAttributes.INDOOR_ALLERGEN_INDEX,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-    },
-    PhilipsApi.PM25: {
-        ATTR_DEVICE_CLASS: SensorDeviceClass.PM25,
-        FanAttributes.ICON_MAP: {0: ICON.PM25},
-        FanAttributes.LABEL: FanAttributes.PM25,
-        FanAttributes.UNIT: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-    },
-    PhilipsApi.NEW_PM25: {
-        ATTR_DEVICE_CLASS: SensorDeviceClass.PM25,
-        FanAttributes.ICON_MAP: {0: ICON.PM25},
-        FanAttributes.LABEL: FanAttributes.PM25,
-        FanAttributes.UNIT: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-    },
-    PhilipsApi.TOTAL_VOLATILE_ORGANIC_COMPOUNDS: {
-        ATTR_DEVICE_CLASS: SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
-        FanAttributes.ICON_MAP: {0: "mdi:blur"},
-        FanAttributes.LABEL: FanAttributes.TOTAL_VOLATILE_ORGANIC_COMPOUNDS,
-        FanAttributes.UNIT: CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-    },
-    PhilipsApi.HUMIDITY: {
-        ATTR_DEVICE_CLASS: SensorDeviceClass.HUMIDITY,
-        FanAttributes.ICON_MAP: {0: "mdi:water-percent"},
-        FanAttributes.LABEL: FanAttributes.HUMIDITY,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-        FanAttributes.UNIT: PERCENTAGE,
-    },
-    PhilipsApi.TEMPERATURE: {
-        ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE,
-        FanAttributes.ICON_MAP: {
-            0: "mdi:thermometer-low",
-            17: "mdi:thermometer",
-            23: "mdi:thermometer-high",
-        },
-        FanAttributes.LABEL: ATTR_TEMPERATURE,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-        FanAttributes.UNIT: UnitOfTemperature.CELSIUS,
-    },
-    # diagnostic information
-    PhilipsApi.WATER_LEVEL: {
-        FanAttributes.ICON_MAP: {0: ICON.WATER_REFILL, 10: "mdi:water"},
-        FanAttributes.LABEL: FanAttributes.WATER_LEVEL,
-        FanAttributes.VALUE: lambda value, status: 0
-        if status.get("err") in [32768, 49408]
-        else value,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-        FanAttributes.UNIT: PERCENTAGE,
-        CONF_ENTITY_CATEGORY: EntityCategory.DIAGNOSTIC,
-    },
-    PhilipsApi.RSSI: {
-        FanAttributes.ICON_MAP: {
-            -150: "mdi:wifi-strength-off-outline",
-            -90: "mdi:wifi-strength-outline",
-            -80: "mdi:wifi-strength-1",
-            -70: "mdi:wifi-strength-2",
-            -67: "mdi:wifi-strength-3",
-            -30: "mdi:wifi-strength-4",
-        },
-        FanAttributes.LABEL: FanAttributes.RSSI,
-        ATTR_STATE_CLASS: SensorStateClass.MEASUREMENT,
-        ATTR_DEVICE_CLASS: SensorDeviceClass.SIGNAL_STRENGTH,
-        FanAttributes.UNIT: SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        CONF_ENTITY_CATEGORY: EntityCategory.DIAGNOSTIC,
-    },
-    # PhilipsApi.RUNTIME: {
-    #     FanAttributes.ICON_MAP: {0: "mdi:timer"},
-    #     FanAttributes.LABEL: FanAttributes.RUNTIME,
-    #     ATTR_STATE_CLASS: SensorStateClass.TOTAL,
-    #     ATTR_DEVICE_CLASS: SensorDeviceClass.DURATION,
-    #     FanAttributes.UNIT: UnitOfTime.MILLISECONDS,
-    #     CONF_ENTITY_CATEGORY: EntityCategory.DIAGNOSTIC,
-    # },
-}
-
-FILTER_TYPES: dict[str, FilterDescription] = {
-    PhilipsApi.FILTER_PRE: {
-        FanAttributes.ICON_MAP: {0: ICON.FILTER_REPLACEMENT, 72: "mdi:dots-grid"},
-        FanAttributes.LABEL: FanAttributes.FILTER_PRE,
-        FanAttributes.TOTAL: PhilipsApi.FILTER_PRE_TOTAL,
-        FanAttributes.TYPE: PhilipsApi.FILTER_PRE_TYPE,
-    },
-    PhilipsApi.FILTER_HEPA: {
-        FanAttributes.ICON_MAP: {0: ICON.FILTER_REPLACEMENT, 72: "mdi:dots-grid"},
-        FanAttributes.LABEL: FanAttributes.FILTER_HEPA,
-        FanAttributes.TOTAL: PhilipsApi.FILTER_HEPA_TOTAL,
-        FanAttributes.TYPE: PhilipsApi.FILTER_HEPA_TYPE,
-    },
-    PhilipsApi.FILTER_ACTIVE_CARBON: {
-        FanAttributes.ICON_MAP: {0: ICON.FILTER_REPLACEMENT, 72: "mdi:dots-grid"},
-        FanAttributes.LABEL: FanAttributes.FILTER_ACTIVE_CARBON,
-        FanAttributes.TOTAL: PhilipsApi.FILTER_ACTIVE_CARBON_TOTAL,
-        FanAttributes.TYPE: PhilipsApi.FILTER_ACTIVE_CARBON_TYPE,
-    },
-    PhilipsApi.FILTER_WICK: {
-        FanAttributes.ICON_MAP: {0: ICON.PREFILTER_WICK_CLEANING, 72: "mdi:dots-grid"},
-        FanAttributes.LABEL: FanAttributes.FILTER_WICK,
-        FanAttributes.TOTAL: PhilipsApi.FILTER_WICK_TOTAL,
-        FanAttributes.TYPE: PhilipsApi.FILTER_WICK_TYPE,
-    },
-    PhilipsApi.FILTER_NANOPROTECT: {
-        FanAttributes.ICON_MAP: {
-            0: ICON.FILTER_REPLACEMENT,
-            10: ICON.NANOPROTECT_FILTER,
-        },
-        FanAttributes.LABEL: FanAttributes.FILTER_NANOPROTECT,
-        FanAttributes.TOTAL: PhilipsApi.FILTER_NANOPROTECT_TOTAL,
-        FanAttributes.TYPE: PhilipsApi.FILTER_NANOPROTECT_TYPE,
-    },
-    PhilipsApi.FILTER_NANOPROTECT_PREFILTER: {
-        FanAttributes.ICON_MAP: {
-            0: ICON.PREFILTER_CLEANING,
-            10: ICON.NANOPROTECT_FILTER,
-        },
-        FanAttributes.LABEL: FanAttributes.FILTER_NANOPROTECT_CLEAN,
-        FanAttributes.TOTAL: PhilipsApi.FILTER_NANOPROTECT_CLEAN_TOTAL,
-        FanAttributes.TYPE: "",
-    },
-}
-
-SWITCH_TYPES: dict[str, SwitchDescription] = {
-    PhilipsApi.CHILD_LOCK: {
-        ATTR_ICON: ICON.CHILD_LOCK_BUTTON,
-        FanAttributes.LABEL: FanAttributes.CHILD_LOCK,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        SWITCH_ON: True,
-        SWITCH_OFF: False,
-    },
-}
-
-LIGHT_TYPES: dict[str, LightDescription] = {
-    PhilipsApi.DISPLAY_BACKLIGHT: {
-        ATTR_ICON: ICON.LIGHT_DIMMING_BUTTON,
-        FanAttributes.LABEL: FanAttributes.DISPLAY_BACKLIGHT,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        SWITCH_ON: "1",
-        SWITCH_OFF: "0",
-    },
-    PhilipsApi.LIGHT_BRIGHTNESS: {
-        ATTR_ICON: "mdi:circle-outline",
-        FanAttributes.LABEL: FanAttributes.LIGHT_BRIGHTNESS,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        SWITCH_ON: 100,
-        SWITCH_OFF: 0,
-        DIMMABLE: True,
-    },
-    PhilipsApi.NEW_DISPLAY_BACKLIGHT: {
-        ATTR_ICON: ICON.LIGHT_DIMMING_BUTTON,
-        FanAttributes.LABEL: FanAttributes.DISPLAY_BACKLIGHT,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        SWITCH_ON: 100,
-        SWITCH_OFF: 0,
-    },
-}
-
-SELECT_TYPES: dict[str, SelectDescription] = {
-    PhilipsApi.FUNCTION: {
-        FanAttributes.LABEL: FanAttributes.FUNCTION,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        OPTIONS: PhilipsApi.FUNCTION_MAP,
-    },
-    PhilipsApi.HUMIDITY_TARGET: {
-        FanAttributes.LABEL: FanAttributes.HUMIDITY_TARGET,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        OPTIONS: PhilipsApi.HUMIDITY_TARGET_MAP,
-    },
-    PhilipsApi.PREFERRED_INDEX: {
-        FanAttributes.LABEL: FanAttributes.PREFERRED_INDEX,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        OPTIONS: PhilipsApi.PREFERRED_INDEX_MAP,
-    },
-    PhilipsApi.PREFERRED_INDEX: {
-        FanAttributes.LABEL: FanAttributes.PREFERRED_INDEX,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        OPTIONS: PhilipsApi.PREFERRED_INDEX_MAP,
-    },
-    PhilipsApi.GAS_PREFERRED_INDEX: {
-        FanAttributes.LABEL: FanAttributes.PREFERRED_INDEX,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        OPTIONS: PhilipsApi.GAS_PREFERRED_INDEX_MAP,
-    },
-    PhilipsApi.NEW_PREFERRED_INDEX: {
-        FanAttributes.LABEL: FanAttributes.PREFERRED_INDEX,
-        CONF_ENTITY_CATEGORY: EntityCategory.CONFIG,
-        OPTIONS: PhilipsApi.NEW_PREFERRED_INDEX_MAP,
-    },
-}
+SELECT_TYPES: Mapping[str, SelectDescription] = MappingProxyType(
+    {
+        PhilipsApi.FUNCTION: SelectDescription(
+            label=FanAttributes.FUNCTION,
+            entity_category=EntityCategory.CONFIG,
+            options=PhilipsApi.FUNCTION_MAP,
+        ),
+        PhilipsApi.HUMIDITY_TARGET: SelectDescription(
+            label=FanAttributes.HUMIDITY_TARGET,
+            entity_category=EntityCategory.CONFIG,
+            options=PhilipsApi.HUMIDITY_TARGET_MAP,
+        ),
+        PhilipsApi.PREFERRED_INDEX: SelectDescription(
+            label=FanAttributes.PREFERRED_INDEX,
+            entity_category=EntityCategory.CONFIG,
+            options=PhilipsApi.PREFERRED_INDEX_MAP,
+        ),
+        PhilipsApi.GAS_PREFERRED_INDEX: SelectDescription(
+            label=FanAttributes.PREFERRED_INDEX,
+            entity_category=EntityCategory.CONFIG,
+            options=PhilipsApi.GAS_PREFERRED_INDEX_MAP,
+        ),
+        PhilipsApi.NEW_PREFERRED_INDEX: SelectDescription(
+            label=FanAttributes.PREFERRED_INDEX,
+            entity_category=EntityCategory.CONFIG,
+            options=PhilipsApi.NEW_PREFERRED_INDEX_MAP,
+        ),
+    }
+)
@@ -5,12 +5,17 @@ from collections.abc import Callable
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import Entity
 
-from .const import CONF_MODEL, DATA_KEY_COORDINATOR, DATA_KEY_FAN, DOMAIN
-from .philips import model_to_class
+from .const import (
+    CONF_MODEL,
+    DATA_KEY_COORDINATOR,
+    DATA_KEY_FAN,
+    DOMAIN,
+)
+from .philips import model_to_class, resolve_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,22 +28,25 @@ async def async_setup_entry(
     """Set up the fan platform."""
     _LOGGER.debug("async_setup_entry called for platform fan")
 
-    host = entry.data[CONF_HOST]
     model = entry.data[CONF_MODEL]
     name = entry.data[CONF_NAME]
 
-    data = hass.data[DOMAIN][host]
+    data = hass.data[DOMAIN][entry.entry_id]
+
+    coordinator = data[DATA_KEY_COORDINATOR]
+    device_id = resolve_device_id(entry.data, coordinator.status)
 
     model_class = model_to_class.get(model)
     if model_class:
         device = model_class(
-            data[DATA_KEY_COORDINATOR],
+            coordinator,
             model=model,
             name=name,
+            device_id=device_id,
         )
     else:
         _LOGGER.error("Unsupported model: %s", model)
         return
 
     data[DATA_KEY_FAN] = device
-    async_add_entities([device], update_before_add=True)
+    async_add_entities([device], update_before_add=False)
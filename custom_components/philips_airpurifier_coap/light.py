@@ -7,32 +7,32 @@ from typing import Any
 
 from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
-    ATTR_ICON,
-    CONF_ENTITY_CATEGORY,
-    CONF_HOST,
-    CONF_NAME,
-)
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import PlatformNotReady
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
 
 from .const import (
     CONF_MODEL,
     DATA_KEY_COORDINATOR,
-    DIMMABLE,
     DOMAIN,
     LIGHT_TYPES,
-    SWITCH_OFF,
-    SWITCH_ON,
-    FanAttributes,
-    PhilipsApi,
 )
-from .philips import Coordinator, PhilipsEntity, model_to_class
+from .philips import (
+    Coordinator,
+    PhilipsEntity,
+    model_to_class,
+    resolve_device_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# display name and unique ID suffix of every light, they only depend on the light key
+_LIGHT_LABELS = {
+    light: description.label.replace("_", " ").title()
+    for light, description in LIGHT_TYPES.items()
+}
+_LIGHT_IDS = {light: light.lower() for light in LIGHT_TYPES}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,27 +42,29 @@ async def async_setup_entry(
     """Set up the light platform."""
     _LOGGER.debug("async_setup_entry called for platform light")
 
-    host = entry.data[CONF_HOST]
     model = entry.data[CONF_MODEL]
     name = entry.data[CONF_NAME]
 
-    data = hass.data[DOMAIN][host]
+    data = hass.data[DOMAIN][entry.entry_id]
 
     coordinator = data[DATA_KEY_COORDINATOR]
+    device_id = resolve_device_id(entry.data, coordinator.status)
 
     model_class = model_to_class.get(model)
     if model_class:
-        available_lights = []
-
-        for cls in reversed(model_class.__mro__):
-            cls_available_lights = getattr(cls, "AVAILABLE_LIGHTS", [])
-            available_lights.extend(cls_available_lights)
+        available_lights = model_class._merged_lights
 
         lights = []
 
         for light in LIGHT_TYPES:
             if light in available_lights:
-                lights.append(PhilipsLight(coordinator, name, model, light))
+                if LIGHT_TYPES[light].dimmable:
+                    light_class = PhilipsDimmableLight
+                else:
+                    light_class = PhilipsOnOffLight
+                lights.append(
+                    light_class(coordinator, name, model, device_id, light)
+                )
 
         async_add_entities(lights, update_before_add=False)
 
@@ -77,73 +79,81 @@ class PhilipsLight(PhilipsEntity, LightEntity):
     _attr_is_on: bool | None = False
 
     def __init__(  # noqa: D107
-        self, coordinator: Coordinator, name: str, model: str, light: str
+        self,
+        coordinator: Coordinator,
+        name: str,
+        model: str,
+        device_id: str,
+        light: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id)
         self._model = model
         self._description = LIGHT_TYPES[light]
-        self._on = self._description.get(SWITCH_ON)
-        self._off = self._description.get(SWITCH_OFF)
-        self._dimmable = self._description.get(DIMMABLE)
-        self._attr_device_class = self._description.get(ATTR_DEVICE_CLASS)
-        self._attr_icon = self._description.get(ATTR_ICON)
-        self._attr_name = (
-            f"{name} {self._description[FanAttributes.LABEL].replace('_', ' ').title()}"
-        )
-        self._attr_entity_category = self._description.get(CONF_ENTITY_CATEGORY)
-
-        if self._dimmable is None:
-            self._dimmable = False
-
-        if self._dimmable:
-            self._attr_color_mode = ColorMode.BRIGHTNESS
-            self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
-        else:
-            self._attr_color_mode = ColorMode.ONOFF
-            self._attr_supported_color_modes = {ColorMode.ONOFF}
-
-        try:
-            device_id = self._device_status[PhilipsApi.DEVICE_ID]
-            self._attr_unique_id = f"{self._model}-{device_id}-{light.lower()}"
-        except Exception as e:
-            _LOGGER.error("Failed retrieving unique_id: %s", e)
-            raise PlatformNotReady
+        self._on = self._description.switch_on
+        self._off = self._description.switch_off
+        # the device reports the light level as a number, whatever type is written
+        self._on_level = int(self._on)
+        self._attr_icon = self._description.icon
+        self._attr_name = f"{name} {_LIGHT_LABELS[light]}"
+        self._attr_entity_category = self._description.entity_category
+
+        self._attr_unique_id = f"{self._model}-{device_id}-{_LIGHT_IDS[light]}"
         self._attrs: dict[str, Any] = {}
         self.kind = light
+        self._update_state()
 
-    @property
-    def is_on(self) -> bool:
-        """Return if the light is on."""
-        status = int(self._device_status.get(self.kind))
-        # _LOGGER.debug("is_on, kind: %s - status: %s - on: %s", self.kind, status, self._on)
-        if self._dimmable:
-            return status > 0
-        else:
-            return status == int(self._on)
-
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of the light."""
-        if self._dimmable:
-            brightness = int(self._device_status.get(self.kind))
-            return round(255 * brightness / 100)
+    def _update_state(self) -> None:
+        """Update the light state from the device status."""
+        value = self._device_status.get(self.kind)
+        self._attr_is_on = value is not None and int(value) == self._on_level
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Turn the light off."""
+        _LOGGER.debug("async_turn_off, kind: %s - value: %s", self.kind, self._off)
+        await self.coordinator.async_set_control_value(self.kind, self._off)
+
+
+class PhilipsOnOffLight(PhilipsLight):
+    """Define a Philips AirPurifier light that can only be switched on and off."""
+
+    _attr_color_mode = ColorMode.ONOFF
+    _attr_supported_color_modes = {ColorMode.ONOFF}
+
+    async def async_turn_on(self, **kwargs) -> None:
+        """Turn the light on."""
+        _LOGGER.debug("async_turn_on, kind: %s - value: %s", self.kind, self._on)
+        await self.coordinator.async_set_control_value(self.kind, self._on)
+
+
+class PhilipsDimmableLight(PhilipsLight):
+    """Define a Philips AirPurifier light with a brightness level."""
+
+    _attr_color_mode = ColorMode.BRIGHTNESS
+    _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
+
+    def _update_state(self) -> None:
+        """Update the light state and brightness from the device status."""
+        brightness = self._device_status.get(self.kind)
+        if brightness is None:
+            self._attr_is_on = False
+            self._attr_brightness = None
         else:
-            return None
+            brightness = int(brightness)
+            self._attr_is_on = brightness > 0
+            self._attr_brightness = round(255 * brightness / 100)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the light on."""
-        if self._dimmable:
-            if ATTR_BRIGHTNESS in kwargs:
-                value = round(100 * int(kwargs[ATTR_BRIGHTNESS]) / 255)
-            else:
-                value = 100
+        if ATTR_BRIGHTNESS in kwargs:
+            value = round(100 * int(kwargs[ATTR_BRIGHTNESS]) / 255)
         else:
-            value = self._on
+            value = 100
 
         _LOGGER.debug("async_turn_on, kind: %s - value: %s", self.kind, value)
-        await self.coordinator.client.set_control_value(self.kind, value)
-
-    async def async_turn_off(self, **kwargs) -> None:
-        """Turn the light off."""
-        _LOGGER.debug("async_turn_off, kind: %s - value: %s", self.kind, self._off)
-        await self.coordinator.client.set_control_value(self.kind, self._off)
+        await self.coordinator.async_set_control_value(self.kind, value)
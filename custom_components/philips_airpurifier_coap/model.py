@@ -1,54 +1,63 @@
 """Type definitions for Philips AirPurifier integration."""
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any, TypedDict
-from xmlrpc.client import boolean
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple
 
 from homeassistant.helpers.typing import StateType
 
 DeviceStatus = dict[str, Any]
 
 
-class _SensorDescription(TypedDict):
-    """Mandatory attributes for a sensor description."""
+class LabeledIcon(NamedTuple):
+    """Label and icon of a device value."""
 
     label: str
+    icon: str
 
 
-class SensorDescription(_SensorDescription, total=False):
+@dataclass(frozen=True, slots=True)
+class SensorDescription:
     """Sensor description class."""
 
-    device_class: str
-    icon: str
-    unit: str
-    state_class: str
-    value: Callable[[Any, DeviceStatus], StateType]
-    icon_map: [int, str]
+    label: str
+    device_class: str | None = None
+    icon: str | None = None
+    unit: str | None = None
+    state_class: str | None = None
+    entity_category: str | None = None
+    value: Callable[[Any, DeviceStatus], StateType] | None = None
+    icon_map: dict[int, str] | None = None
     # warn_value: int
     # warn_icon: str
 
 
-class FilterDescription(TypedDict):
+@dataclass(frozen=True, slots=True)
+class FilterDescription:
     """Filter description class."""
 
-    prefix: str
-    postfix: str
-    icon: str
-    icon_map: [int, str]
+    label: str
+    total: str
+    type: str
+    icon_map: dict[int, str]
     # warn_icon: str
     # warn_value: int
 
 
-class SwitchDescription(TypedDict):
+@dataclass(frozen=True, slots=True)
+class SwitchDescription:
     """Switch description class."""
 
     icon: str
     label: str
     entity_category: str
+    switch_on: Any
+    switch_off: Any
 
 
-class LightDescription(TypedDict):
+@dataclass(frozen=True, slots=True)
+class LightDescription:
     """Light description class."""
 
     icon: str
@@ -56,12 +65,13 @@ class LightDescription(TypedDict):
     entity_category: str
     switch_on: Any
     switch_off: Any
-    dimmable: boolean
+    dimmable: bool = False
 
 
-class SelectDescription(TypedDict):
+@dataclass(frozen=True, slots=True)
+class SelectDescription:
     """Select description class."""
 
     label: str
     entity_category: str
-    options: dict[Any, tuple[str, str]]
+    options: Mapping[Any, LabeledIcon]
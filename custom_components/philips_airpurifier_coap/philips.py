@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import asyncio
 from asyncio.tasks import Task
-from collections.abc import Callable
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
 import contextlib
-from datetime import timedelta
 import logging
+import sys
+from types import MappingProxyType
 from typing import Any, Optional, Union
 
 from aioairctrl import CoAPClient
@@ -14,13 +16,11 @@ from aioairctrl import CoAPClient
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ConfigEntryNotReady, PlatformNotReady
-from homeassistant.helpers.entity import Entity
-from homeassistant.util.percentage import (
-    ordered_list_item_to_percentage,
-    percentage_to_ordered_list_item,
-)
+from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.util.percentage import ordered_list_item_to_percentage
 
 from .const import (
+    CONF_DEVICE_ID,
     DOMAIN,
     ICON,
     SWITCH_ON,
@@ -29,13 +29,80 @@ from .const import (
     PhilipsApi,
     PresetMode,
 )
-from .model import DeviceStatus
+from .model import DeviceStatus, LabeledIcon
 from .timer import Timer
 
 _LOGGER = logging.getLogger(__name__)
 
 MISSED_PACKAGE_COUNT = 3
 
+# maximum number of control writes in flight per device
+MAX_INFLIGHT = 8
+
+# status keys and a map from their values to the position and name of a pattern
+PatternIndex = tuple[tuple[tuple[str, ...], dict[tuple, tuple[int, str]]], ...]
+
+
+def _build_pattern_index(patterns: Mapping[str, Mapping[str, Any]]) -> PatternIndex:
+    """Index status patterns by their values, grouped by the keys they check."""
+    groups: dict[frozenset, tuple[tuple[str, ...], dict]] = {}
+    for position, (name, pattern) in enumerate(patterns.items()):
+        keys, values = groups.setdefault(frozenset(pattern), (tuple(pattern), {}))
+        # the first pattern wins, just like when checking them one after the other
+        values.setdefault(tuple(pattern[key] for key in keys), (position, name))
+    return tuple(groups.values())
+
+
+def _match_pattern(index: PatternIndex, status: DeviceStatus) -> Optional[str]:
+    """Return the name of the first pattern matching the status."""
+    match = None
+    for keys, values in index:
+        found = values.get(tuple(map(status.get, keys)))
+        if found is not None and (match is None or found < match):
+            match = found
+    return match[1] if match is not None else None
+
+
+def _attribute_resolver(
+    value_map: Union[Mapping, Callable[[Any, Any], Any], None]
+) -> Optional[Callable[[Any, Any], Any]]:
+    """Return a function converting a raw status value for an attribute, if needed."""
+    if isinstance(value_map, Mapping):
+        labels = {
+            raw: mapped.label if isinstance(mapped, LabeledIcon) else mapped
+            for raw, mapped in value_map.items()
+        }
+        return lambda value, _: labels.get(value, value)
+    if callable(value_map):
+        return value_map
+    return None
+
+
+def _format_runtime(value: int, _: Any) -> str:
+    """Format a runtime in milliseconds like str(timedelta) does."""
+    minutes, seconds = divmod(round(value / 1000), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        plural = "s" if days != 1 else ""
+        return f"{days} day{plural}, {hours}:{minutes:02d}:{seconds:02d}"
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+def _intern_keys(status: DeviceStatus) -> DeviceStatus:
+    """Return the status with its keys interned, so they match the PhilipsApi names."""
+    intern = sys.intern
+    return {intern(key): value for key, value in status.items()}
+
+
+def resolve_device_id(entry_data: Mapping[str, Any], status: DeviceStatus) -> str:
+    """Return the device ID of an entry, read from the status for older entries."""
+    device_id = entry_data.get(CONF_DEVICE_ID) or status.get(PhilipsApi.DEVICE_ID)
+    if device_id is None:
+        _LOGGER.error("Failed retrieving the device ID")
+        raise PlatformNotReady
+    return device_id
+
 
 class Coordinator:
     """Class to coordinate the data requests from the Philips API."""
@@ -50,6 +117,8 @@ class Coordinator:
         # annoying checks that status is not None when it was already checked
         # during setup.
         self.status: DeviceStatus = None  # type: ignore[assignment]
+        # increased with every received status, so entities can tell when it changed
+        self.status_version = 0
 
         self._listeners: list[CALLBACK_TYPE] = []
         self._task: Task | None = None
@@ -57,6 +126,11 @@ class Coordinator:
         self._reconnect_task: Task | None = None
         self._timeout: int = 60
 
+        # control values waiting to be sent together with the next write
+        self._pending_writes: dict[str, Any] = {}
+        self._flush_task: Task | None = None
+        self._write_semaphore = asyncio.Semaphore(MAX_INFLIGHT)
+
         # Timeout = MAX_AGE * 3 Packet losses
         _LOGGER.debug("init: Creating and autostarting timer for host %s", self._host)
         self._timer_disconnected = Timer(
@@ -76,6 +150,12 @@ class Coordinator:
         if self._timer_disconnected is not None:
             _LOGGER.debug("shutdown: cancelling timeout task for host %s", self._host)
             self._timer_disconnected.cancel()
+        if self._task is not None:
+            _LOGGER.debug("shutdown: cancelling observe task for host %s", self._host)
+            task, self._task = self._task, None
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
         if self.client is not None:
             await self.client.shutdown()
 
@@ -116,7 +196,9 @@ class Coordinator:
         """Refresh the data for the first time."""
         _LOGGER.debug("async_first_refresh for host %s", self._host)
         try:
-            self.status, timeout = await self.client.get_status()
+            status, timeout = await self.client.get_status()
+            self.status = _intern_keys(status)
+            self.status_version += 1
             self._timeout = timeout
             if self._timer_disconnected is not None:
                 self._timer_disconnected.setTimeout(timeout * MISSED_PACKAGE_COUNT)
@@ -153,12 +235,51 @@ class Coordinator:
             self._task.cancel()
             self._task = None
 
+    async def async_set_control_value(self, key: str, value: Any) -> None:
+        """Set a control value, batching writes issued at the same time."""
+        await self.async_queue_control_values({key: value})
+
+    async def async_queue_control_values(self, data: Mapping[str, Any]) -> None:
+        """Set control values together with the other writes issued at the same time."""
+        self._pending_writes.update(data)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._async_flush_writes())
+            self._flush_task.add_done_callback(self._flush_done)
+        await asyncio.shield(self._flush_task)
+
+    def _flush_done(self, task: Task) -> None:
+        # the waiting callers get the failure, but they may all have been cancelled
+        if not task.cancelled() and (ex := task.exception()) is not None:
+            _LOGGER.debug("Failed setting control values for %s: %s", self._host, ex)
+
+    async def _async_flush_writes(self) -> None:
+        try:
+            # yield once, so that all writes of the current loop iteration are collected
+            await asyncio.sleep(0)
+            data = self._pending_writes
+            self._pending_writes = {}
+        finally:
+            # writes queued from here on go into the next batch
+            self._flush_task = None
+        await self.async_set_control_values(data)
+
+    async def async_set_control_values(self, data: dict[str, Any]) -> None:
+        """Set control values right away, limiting the number of writes in flight."""
+        async with self._write_semaphore:
+            _LOGGER.debug("Setting control values for host %s: %s", self._host, data)
+            await self.client.set_control_values(data=data)
+
     async def _async_observe_status(self) -> None:
         async for status in self.client.observe_status():
             _LOGGER.debug("Status update: %s", status)
-            self.status = status
-            self._timer_disconnected.reset()
-            for update_callback in self._listeners:
+            self._timer_disconnected.touch()
+            # a repeated status still shows the device is alive, but changes nothing
+            if status == self.status:
+                continue
+            self.status = _intern_keys(status)
+            self.status_version += 1
+            # a listener may remove itself while being notified
+            for update_callback in tuple(self._listeners):
                 update_callback()
 
     def _start_observing(self) -> None:
@@ -166,55 +287,47 @@ class Coordinator:
         if self._task:
             self._task.cancel()
             self._task = None
-        self._task = asyncio.create_task(self._async_observe_status())
+        self._task = asyncio.create_task(
+            self._async_observe_status(), name=f"philips_observe_{self._host}"
+        )
         self._timer_disconnected.reset()
 
 
 class PhilipsEntity(Entity):
     """Class to represent a generic Philips entity."""
 
-    def __init__(self, coordinator: Coordinator) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self, coordinator: Coordinator, device_id: str
+    ) -> None:
         super().__init__()
         _LOGGER.debug("PhilipsEntity __init__ called")
         _LOGGER.debug("coordinator.status is: %s", coordinator.status)
         self.coordinator = coordinator
-        self._serialNumber = coordinator.status[PhilipsApi.DEVICE_ID]
-        # self._name = coordinator.status["name"]
-        self._name = list(
-            filter(
-                None,
-                map(coordinator.status.get, [PhilipsApi.NAME, PhilipsApi.NEW_NAME]),
-            )
-        )[0]
-        # self._modelName = coordinator.status["modelid"]
-        self._modelName = list(
-            filter(
-                None,
-                map(
-                    coordinator.status.get,
-                    [PhilipsApi.MODEL_ID, PhilipsApi.NEW_MODEL_ID],
-                ),
-            )
-        )[0]
-        self._firmware = coordinator.status["WifiVersion"]
+        status = coordinator.status
+        self._serialNumber = device_id
+        # older devices report name and model under the old keys, newer under the new
+        self._name = status.get(PhilipsApi.NAME) or status.get(PhilipsApi.NEW_NAME)
+        self._modelName = status.get(PhilipsApi.MODEL_ID) or status.get(
+            PhilipsApi.NEW_MODEL_ID
+        )
+        if not self._name or not self._modelName:
+            _LOGGER.error("Failed retrieving name and model: %s", status)
+            raise PlatformNotReady
+        self._firmware = status[PhilipsApi.WIFI_VERSION]
         self._manufacturer = "Philips"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._serialNumber)},
+            name=self._name,
+            model=self._modelName,
+            manufacturer=self._manufacturer,
+            sw_version=self._firmware,
+        )
 
     @property
     def should_poll(self) -> bool:
         """No need to poll. Coordinator notifies entity of updates."""
         return False
 
-    @property
-    def device_info(self):
-        """Return info about the device."""
-        return {
-            "identifiers": {(DOMAIN, self._serialNumber)},
-            "name": self._name,
-            "model": self._modelName,
-            "manufacturer": self._manufacturer,
-            "sw_version": self._firmware,
-        }
-
     @property
     def available(self):
         """Return if the device is available."""
@@ -246,21 +359,14 @@ class PhilipsGenericFan(PhilipsEntity, FanEntity):
         coordinator: Coordinator,
         model: str,
         name: str,
+        device_id: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id)
         self._model = model
         self._name = name
-        self._unique_id = None
-
-    @property
-    def unique_id(self) -> Optional[str]:
-        """Return the unique ID of the fan."""
-        return self._unique_id
-
-    @property
-    def name(self) -> str:
-        """Return the name of the fan."""
-        return self._name
+        self._attr_name = name
+        # the fan names the device after the config entry
+        self._attr_device_info["name"] = name
 
     @property
     def icon(self) -> str:
@@ -281,61 +387,105 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
     STATE_POWER_ON = "1"
     STATE_POWER_OFF = "0"
 
+    # merged over the class hierarchy when a model class is defined
+    _merged_preset_modes: Mapping[str, dict[str, Any]] = MappingProxyType({})
+    _merged_preset_mode_names: list[str] = []
+    _merged_speeds: Mapping[str, dict[str, Any]] = MappingProxyType({})
+    _merged_speed_names: list[str] = []
+    _merged_attributes: tuple = ()
+    _preset_mode_index: PatternIndex = ()
+    _speed_index: PatternIndex = ()
+    _speed_percentages: Mapping[str, int] = MappingProxyType({})
+    _speed_upper_bounds: tuple[int, ...] = ()
+    _merged_switches: frozenset[str] = frozenset()
+    _merged_lights: frozenset[str] = frozenset()
+    _merged_selects: frozenset[str] = frozenset()
+    _merged_unavailable_filters: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Merge the entity definitions of a model class and its bases."""
+        super().__init_subclass__(**kwargs)
+        mro = tuple(reversed(cls.__mro__))
+
+        def merged(name: str) -> tuple:
+            return tuple(item for base in mro for item in getattr(base, name, ()))
+
+        preset_modes = {}
+        speeds = {}
+        for base in mro:
+            preset_modes.update(getattr(base, "AVAILABLE_PRESET_MODES", {}))
+            speeds.update(getattr(base, "AVAILABLE_SPEEDS", {}))
+        attributes = merged("AVAILABLE_ATTRIBUTES")
+        # the platforms only check membership, their own tables define the order
+        cls._merged_switches = frozenset(merged("AVAILABLE_SWITCHES"))
+        cls._merged_lights = frozenset(merged("AVAILABLE_LIGHTS"))
+        cls._merged_selects = frozenset(merged("AVAILABLE_SELECTS"))
+        cls._merged_unavailable_filters = frozenset(merged("UNAVAILABLE_FILTERS"))
+        cls._merged_preset_modes = MappingProxyType(preset_modes)
+        cls._merged_preset_mode_names = list(preset_modes)
+        cls._preset_mode_index = _build_pattern_index(preset_modes)
+        cls._merged_speeds = MappingProxyType(speeds)
+        cls._merged_speed_names = list(speeds)
+        cls._speed_index = _build_pattern_index(speeds)
+        cls._speed_percentages = MappingProxyType(
+            {
+                speed: ordered_list_item_to_percentage(cls._merged_speed_names, speed)
+                for speed in speeds
+            }
+        )
+        # each speed covers the percentages up to its own, in the order of the speeds
+        cls._speed_upper_bounds = tuple(cls._speed_percentages.values())
+        # some philips keys are not unique, so # serves as a marker and is filtered out
+        cls._merged_attributes = tuple(
+            (
+                key,
+                philips_key.partition("#")[0],
+                _attribute_resolver(rest[0] if rest else None),
+            )
+            for key, philips_key, *rest in attributes
+        )
+
     def __init__(  # noqa: D107
         self,
         coordinator: Coordinator,
         model: str,
         name: str,
+        device_id: str,
     ) -> None:
-        super().__init__(coordinator, model, name)
+        super().__init__(coordinator, model, name, device_id)
 
-        self._preset_modes = []
-        self._available_preset_modes = {}
-        self._collect_available_preset_modes()
+        # the power state is checked on every state write and icon lookup
+        self._power_key = self.KEY_PHILIPS_POWER
+        self._power_on = self.STATE_POWER_ON
 
-        self._speeds = []
-        self._available_speeds = {}
-        self._collect_available_speeds()
+        self._available_preset_modes = self._merged_preset_modes
+        self._preset_modes = self._merged_preset_mode_names
 
-        self._available_attributes = []
-        self._collect_available_attributes()
+        self._available_speeds = self._merged_speeds
+        self._speeds = self._merged_speed_names
 
-        try:
-            device_id = self._device_status[PhilipsApi.DEVICE_ID]
-            self._unique_id = f"{self._model}-{device_id}"
-        except Exception as e:
-            _LOGGER.error("Failed retrieving unique_id: %s", e)
-            raise PlatformNotReady
+        # these only depend on the model, so Home Assistant can read them directly
+        self._attr_preset_modes = self._preset_modes
+        self._attr_speed_count = len(self._speeds)
+        self._attr_supported_features = FanEntityFeature.PRESET_MODE
+        if self._speeds:
+            self._attr_supported_features |= FanEntityFeature.SET_SPEED
 
-    def _collect_available_preset_modes(self):
-        preset_modes = {}
-        for cls in reversed(self.__class__.__mro__):
-            cls_preset_modes = getattr(cls, "AVAILABLE_PRESET_MODES", {})
-            preset_modes.update(cls_preset_modes)
-        self._available_preset_modes = preset_modes
-        self._preset_modes = list(self._available_preset_modes.keys())
+        self._available_attributes = self._merged_attributes
+        # values derived from the status, kept until the coordinator receives a new one
+        self._derived_version: int | None = None
+        self._derived_preset_mode: Optional[str] = None
+        self._derived_percentage: Optional[int] = None
+        self._attrs: dict[str, Any] = {}
 
-    def _collect_available_speeds(self):
-        speeds = {}
-        for cls in reversed(self.__class__.__mro__):
-            cls_speeds = getattr(cls, "AVAILABLE_SPEEDS", {})
-            speeds.update(cls_speeds)
-        self._available_speeds = speeds
-        self._speeds = list(self._available_speeds.keys())
-
-    def _collect_available_attributes(self):
-        attributes = []
-        for cls in reversed(self.__class__.__mro__):
-            cls_attributes = getattr(cls, "AVAILABLE_ATTRIBUTES", [])
-            attributes.extend(cls_attributes)
-        self._available_attributes = attributes
+        self._attr_unique_id = f"{self._model}-{device_id}"
 
     @property
     def is_on(self) -> bool:
         """Return if the fan is on."""
-        status = self._device_status.get(self.KEY_PHILIPS_POWER)
-        # _LOGGER.debug("is_on: status=%s - test=%s", status, self.STATE_POWER_ON)
-        return status == self.STATE_POWER_ON
+        status = self._device_status.get(self._power_key)
+        # _LOGGER.debug("is_on: status=%s - test=%s", status, self._power_on)
+        return status == self._power_on
 
     async def async_turn_on(
         self,
@@ -350,98 +500,77 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
         if percentage:
             await self.async_set_percentage(percentage)
             return
-        await self.coordinator.client.set_control_value(
+        await self.coordinator.async_set_control_value(
             self.KEY_PHILIPS_POWER, self.STATE_POWER_ON
         )
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the fan off."""
-        await self.coordinator.client.set_control_value(
+        await self.coordinator.async_set_control_value(
             self.KEY_PHILIPS_POWER, self.STATE_POWER_OFF
         )
 
-    @property
-    def supported_features(self) -> int:
-        """Return the supported features."""
-        features = FanEntityFeature.PRESET_MODE
-        if self._speeds:
-            features |= FanEntityFeature.SET_SPEED
-        return features
-
-    @property
-    def preset_modes(self) -> Optional[list[str]]:
-        """Return the supported preset modes."""
-        return self._preset_modes
-
     @property
     def preset_mode(self) -> Optional[str]:
         """Return the selected preset mode."""
-        for preset_mode, status_pattern in self._available_preset_modes.items():
-            for k, v in status_pattern.items():
-                if self._device_status.get(k) != v:
-                    break
-            else:
-                return preset_mode
+        self._update_derived_state()
+        return self._derived_preset_mode
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode of the fan."""
         status_pattern = self._available_preset_modes.get(preset_mode)
         if status_pattern:
-            await self.coordinator.client.set_control_values(data=status_pattern)
+            await self.coordinator.async_queue_control_values(status_pattern)
 
-    @property
-    def speed_count(self) -> int:
-        """Return the number of speed options."""
-        return len(self._speeds)
+    def _speed_for_percentage(self, percentage: int) -> Optional[str]:
+        """Return the speed for a percentage, like percentage_to_ordered_list_item."""
+        if not self._speeds:
+            return None
+        index = bisect_left(self._speed_upper_bounds, percentage)
+        return self._speeds[min(index, len(self._speeds) - 1)]
 
     @property
     def percentage(self) -> Optional[int]:
         """Return the speed percentages."""
-        for speed, status_pattern in self._available_speeds.items():
-            for k, v in status_pattern.items():
-                if self._device_status.get(k) != v:
-                    break
-            else:
-                return ordered_list_item_to_percentage(self._speeds, speed)
+        self._update_derived_state()
+        return self._derived_percentage
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Return the selected speed percentage."""
         if percentage == 0:
             await self.async_turn_off()
         else:
-            speed = percentage_to_ordered_list_item(self._speeds, percentage)
+            speed = self._speed_for_percentage(percentage)
             status_pattern = self._available_speeds.get(speed)
             if status_pattern:
-                await self.coordinator.client.set_control_values(data=status_pattern)
+                await self.coordinator.async_queue_control_values(status_pattern)
 
     @property
     def extra_state_attributes(self) -> Optional[dict[str, Any]]:
         """Return the extra state attributes."""
+        self._update_derived_state()
+        return self._attrs
 
-        def append(
-            attributes: dict,
-            key: str,
-            philips_key: str,
-            value_map: Union[dict, Callable[[Any, Any], Any]] = None,
-        ):
-            # some philips keys are not unique, so # serves as a marker and needs to be filtered out
-            philips_clean_key = philips_key.partition("#")[0]
-
-            if philips_clean_key in self._device_status:
-                value = self._device_status[philips_clean_key]
-                if isinstance(value_map, dict) and value in value_map:
-                    value = value_map.get(value, "unknown")
-                    if isinstance(value, tuple):
-                        value = value[0]
-                elif callable(value_map):
-                    value = value_map(value, self._device_status)
-                attributes.update({key: value})
+    def _update_derived_state(self) -> None:
+        """Derive preset mode, speed and attributes once per received status."""
+        version = self.coordinator.status_version
+        if self._derived_version == version:
+            return
+
+        status = self._device_status
+        self._derived_preset_mode = _match_pattern(self._preset_mode_index, status)
+        speed = _match_pattern(self._speed_index, status)
+        self._derived_percentage = self._speed_percentages.get(speed)
 
         device_attributes = {}
-        for key, philips_key, *rest in self._available_attributes:
-            value_map = rest[0] if len(rest) else None
-            append(device_attributes, key, philips_key, value_map)
-        return device_attributes
+        for key, philips_key, resolver in self._available_attributes:
+            if philips_key in status:
+                value = status[philips_key]
+                if resolver is not None:
+                    value = resolver(value, status)
+                device_attributes[key] = value
+        self._attrs = device_attributes
+        self._derived_version = version
 
     @property
     def icon(self) -> str:
@@ -449,13 +578,8 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
         if not self.is_on:
             return ICON.POWER_BUTTON
 
-        preset_mode = self.preset_mode
-        if preset_mode is None:
-            return ICON.FAN_SPEED_BUTTON
-        if preset_mode in PresetMode.ICON_MAP:
-            return PresetMode.ICON_MAP[preset_mode]
-
-        return ICON.FAN_SPEED_BUTTON
+        # no preset mode or one without an icon shows the fan speed
+        return PresetMode.ICON_MAP.get(self.preset_mode, ICON.FAN_SPEED_BUTTON)
 
 
 class PhilipsGenericCoAPFan(PhilipsGenericCoAPFanBase):
@@ -487,7 +611,7 @@ class PhilipsGenericCoAPFan(PhilipsGenericCoAPFanBase):
         (
             FanAttributes.RUNTIME,
             PhilipsApi.RUNTIME,
-            lambda x, _: str(timedelta(seconds=round(x / 1000))),
+            _format_runtime,
         ),
     ]
 
@@ -524,7 +648,7 @@ class PhilipsNewGenericCoAPFan(PhilipsGenericCoAPFanBase):
         (
             FanAttributes.RUNTIME,
             PhilipsApi.RUNTIME,
-            lambda x, _: str(timedelta(seconds=round(x / 1000))),
+            _format_runtime,
         ),
     ]
 
@@ -628,72 +752,63 @@ class PhilipsAC1214(PhilipsGenericCoAPFan):
         """Set the preset mode to Allergen."""
         _LOGGER.debug("AC1214 switches to mode 'A' first")
         a_status_pattern = self._available_preset_modes.get(PresetMode.ALLERGEN)
-        await self.coordinator.client.set_control_values(data=a_status_pattern)
+        await self.coordinator.async_set_control_values(a_status_pattern)
         await asyncio.sleep(1)
 
-    async def async_set_preset_mode(self, preset_mode: str) -> None:
-        """Set the preset mode of the fan."""
-        _LOGGER.debug("AC1214 async_set_preset_mode is called with: %s", preset_mode)
-
+    async def _async_power_on(self) -> None:
+        """Switch the device on without setting a mode, if it is off."""
         # the AC1214 doesn't like it if we set a preset mode to switch on the device,
         # so it needs to be done in sequence
         if not self.is_on:
             _LOGGER.debug("AC1214 is switched on without setting a mode")
-            await self.coordinator.client.set_control_value(
-                PhilipsApi.POWER, PhilipsApi.POWER_MAP[SWITCH_ON]
+            await self.coordinator.async_set_control_values(
+                {PhilipsApi.POWER: PhilipsApi.POWER_MAP[SWITCH_ON]}
             )
             await asyncio.sleep(1)
 
-        # the AC1214 also doesn't seem to like switching to mode 'M' without cycling through mode 'A'
-        current_pattern = self._available_preset_modes.get(self.preset_mode)
+    async def _async_apply_pattern(self, status_pattern: dict[str, Any]) -> None:
+        """Set a mode or speed pattern, cycling through mode 'A' where needed."""
+        current_pattern = self._available_preset_modes.get(self.preset_mode) or {}
         _LOGGER.debug("AC1214 is currently on mode: %s", current_pattern)
+        # the AC1214 also doesn't seem to like switching to mode 'M' without cycling through mode 'A'
+        if (
+            status_pattern.get(PhilipsApi.MODE) != "A"
+            and current_pattern.get(PhilipsApi.MODE) != "M"
+        ):
+            await self.async_set_a()
+        await self.coordinator.async_set_control_values(status_pattern)
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("AC1214 async_set_preset_mode is called with: %s", preset_mode)
+
+        await self._async_power_on()
+
         if preset_mode:
             _LOGGER.debug("AC1214 preset mode requested: %s", preset_mode)
             status_pattern = self._available_preset_modes.get(preset_mode)
             _LOGGER.debug("this corresponds to status pattern: %s", status_pattern)
-            if (
-                status_pattern
-                and status_pattern.get(PhilipsApi.MODE) != "A"
-                and current_pattern.get(PhilipsApi.MODE) != "M"
-            ):
-                await self.async_set_a()
-            _LOGGER.debug("AC1214 sets preset mode to: %s", preset_mode)
             if status_pattern:
-                await self.coordinator.client.set_control_values(data=status_pattern)
+                _LOGGER.debug("AC1214 sets preset mode to: %s", preset_mode)
+                await self._async_apply_pattern(status_pattern)
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the preset mode of the fan."""
         _LOGGER.debug("AC1214 async_set_percentage is called with: %s", percentage)
 
-        # the AC1214 doesn't like it if we set a preset mode to switch on the device,
-        # so it needs to be done in sequence
-        if not self.is_on:
-            _LOGGER.debug("AC1214 is switched on without setting a mode")
-            await self.coordinator.client.set_control_value(
-                PhilipsApi.POWER, PhilipsApi.POWER_MAP[SWITCH_ON]
-            )
-            await asyncio.sleep(1)
+        await self._async_power_on()
 
-        current_pattern = self._available_preset_modes.get(self.preset_mode)
-        _LOGGER.debug("AC1214 is currently on mode: %s", current_pattern)
         if percentage == 0:
             _LOGGER.debug("AC1214 uses 0% to switch off")
             await self.async_turn_off()
         else:
-            # the AC1214 also doesn't seem to like switching to mode 'M' without cycling through mode 'A'
             _LOGGER.debug("AC1214 speed change requested: %s", percentage)
-            speed = percentage_to_ordered_list_item(self._speeds, percentage)
+            speed = self._speed_for_percentage(percentage)
             status_pattern = self._available_speeds.get(speed)
             _LOGGER.debug("this corresponds to status pattern: %s", status_pattern)
-            if (
-                status_pattern
-                and status_pattern.get(PhilipsApi.MODE) != "A"
-                and current_pattern.get(PhilipsApi.MODE) != "M"
-            ):
-                await self.async_set_a()
-            _LOGGER.debug("AC1214 sets speed percentage to: %s", percentage)
             if status_pattern:
-                await self.coordinator.client.set_control_values(data=status_pattern)
+                _LOGGER.debug("AC1214 sets speed percentage to: %s", percentage)
+                await self._async_apply_pattern(status_pattern)
 
     async def async_turn_on(
         self,
@@ -707,14 +822,7 @@ class PhilipsAC1214(PhilipsGenericCoAPFan):
             percentage,
             preset_mode,
         )
-        # the AC1214 doesn't like it if we set a preset mode to switch on the device,
-        # so it needs to be done in sequence
-        if not self.is_on:
-            _LOGGER.debug("AC1214 is switched on without setting a mode")
-            await self.coordinator.client.set_control_value(
-                PhilipsApi.POWER, PhilipsApi.POWER_MAP[SWITCH_ON]
-            )
-            await asyncio.sleep(1)
+        await self._async_power_on()
 
         if preset_mode:
             _LOGGER.debug("AC1214 preset mode requested: %s", preset_mode)
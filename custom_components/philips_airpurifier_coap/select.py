@@ -7,26 +7,22 @@ from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
-    CONF_ENTITY_CATEGORY,
-    CONF_HOST,
-    CONF_NAME,
-)
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.entity import Entity
 
 from .const import (
     CONF_MODEL,
     DATA_KEY_COORDINATOR,
     DOMAIN,
-    OPTIONS,
     SELECT_TYPES,
-    FanAttributes,
-    PhilipsApi,
 )
-from .philips import Coordinator, PhilipsEntity, model_to_class
+from .philips import (
+    Coordinator,
+    PhilipsEntity,
+    model_to_class,
+    resolve_device_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,27 +35,25 @@ async def async_setup_entry(
     """Set up the select platform."""
     _LOGGER.debug("async_setup_entry called for platform select")
 
-    host = entry.data[CONF_HOST]
     model = entry.data[CONF_MODEL]
     name = entry.data[CONF_NAME]
 
-    data = hass.data[DOMAIN][host]
+    data = hass.data[DOMAIN][entry.entry_id]
 
     coordinator = data[DATA_KEY_COORDINATOR]
+    device_id = resolve_device_id(entry.data, coordinator.status)
 
     model_class = model_to_class.get(model)
     if model_class:
-        available_selects = []
-
-        for cls in reversed(model_class.__mro__):
-            cls_available_selects = getattr(cls, "AVAILABLE_SELECTS", [])
-            available_selects.extend(cls_available_selects)
+        available_selects = model_class._merged_selects
 
         selects = []
 
         for select in SELECT_TYPES:
             if select in available_selects:
-                selects.append(PhilipsSelect(coordinator, name, model, select))
+                selects.append(
+                    PhilipsSelect(coordinator, name, model, device_id, select)
+                )
 
         async_add_entities(selects, update_before_add=False)
 
@@ -74,33 +68,32 @@ class PhilipsSelect(PhilipsEntity, SelectEntity):
     _attr_is_on: bool | None = False
 
     def __init__(  # noqa: D107
-        self, coordinator: Coordinator, name: str, model: str, select: str
+        self,
+        coordinator: Coordinator,
+        name: str,
+        model: str,
+        device_id: str,
+        select: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id)
         self._model = model
         self._description = SELECT_TYPES[select]
-        self._attr_device_class = self._description.get(ATTR_DEVICE_CLASS)
-        label = FanAttributes.LABEL
-        label = label.partition("#")[0]
-        self._attr_name = f"{name} {self._description[label].replace('_', ' ').title()}"
-        self._attr_entity_category = self._description.get(CONF_ENTITY_CATEGORY)
+        self._attr_name = f"{name} {self._description.label.replace('_', ' ').title()}"
+        self._attr_entity_category = self._description.entity_category
 
         self._attr_options = []
         self._icons = {}
         self._options = {}
-        options = self._description.get(OPTIONS)
-        for key, option_tuple in options.items():
-            option_name, icon = option_tuple
+        self._option_keys = {}
+        options = self._description.options
+        for key, option in options.items():
+            option_name = option.label
             self._attr_options.append(option_name)
-            self._icons[option_name] = icon
+            self._icons[option_name] = option.icon
             self._options[key] = option_name
+            self._option_keys[option_name] = key
 
-        try:
-            device_id = self._device_status[PhilipsApi.DEVICE_ID]
-            self._attr_unique_id = f"{self._model}-{device_id}-{select.lower()}"
-        except Exception as e:
-            _LOGGER.error("Failed retrieving unique_id: %s", e)
-            raise PlatformNotReady
+        self._attr_unique_id = f"{self._model}-{device_id}-{select.lower()}"
         self._attrs: dict[str, Any] = {}
         self.kind = select.partition("#")[0]
 
@@ -118,16 +111,14 @@ class PhilipsSelect(PhilipsEntity, SelectEntity):
             _LOGGER.error("Cannot set empty option '%s'", option)
             return
         try:
-            option_key = next(
-                key for key, value in self._options.items() if value == option
-            )
+            option_key = self._option_keys[option]
             _LOGGER.debug(
                 "async_selection_option, kind: %s - option: %s - value: %s",
                 self.kind,
                 option,
                 option_key,
             )
-            await self.coordinator.client.set_control_value(self.kind, option_key)
+            await self.coordinator.async_set_control_value(self.kind, option_key)
         except Exception as e:
             # TODO: catching Exception is actually too broad and needs to be tightened
             _LOGGER.error("Failed setting option: '%s' with error: %s", option, e)
@@ -2,22 +2,17 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import timedelta
 import logging
 from typing import Any, cast
 
-from homeassistant.components.sensor import ATTR_STATE_CLASS, SensorEntity
+from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
-    CONF_ENTITY_CATEGORY,
-    CONF_HOST,
     CONF_NAME,
     PERCENTAGE,
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.entity import Entity, EntityCategory
 from homeassistant.helpers.typing import StateType
 
@@ -28,9 +23,13 @@ from .const import (
     FILTER_TYPES,
     SENSOR_TYPES,
     FanAttributes,
-    PhilipsApi,
 )
-from .philips import Coordinator, PhilipsEntity, model_to_class
+from .philips import (
+    Coordinator,
+    PhilipsEntity,
+    model_to_class,
+    resolve_device_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,32 +41,29 @@ async def async_setup_entry(  # noqa: D103
 ) -> None:
     _LOGGER.debug("async_setup_entry called for platform sensor")
 
-    host = entry.data[CONF_HOST]
     model = entry.data[CONF_MODEL]
     name = entry.data[CONF_NAME]
 
-    data = hass.data[DOMAIN][host]
+    data = hass.data[DOMAIN][entry.entry_id]
 
     coordinator = data[DATA_KEY_COORDINATOR]
+    device_id = resolve_device_id(entry.data, coordinator.status)
     status = coordinator.status
 
     sensors = []
 
     for sensor in SENSOR_TYPES:
         if sensor in status:
-            sensors.append(PhilipsSensor(coordinator, name, model, sensor))
+            sensors.append(PhilipsSensor(coordinator, name, model, device_id, sensor))
 
     model_class = model_to_class.get(model)
-    unavailable_filters = []
-
-    if model_class:
-        for cls in reversed(model_class.__mro__):
-            cls_unavailable_filters = getattr(cls, "UNAVAILABLE_FILTERS", [])
-            unavailable_filters.extend(cls_unavailable_filters)
+    unavailable_filters = model_class._merged_unavailable_filters if model_class else ()
 
     for _filter in FILTER_TYPES:
         if _filter in status and _filter not in unavailable_filters:
-            sensors.append(PhilipsFilterSensor(coordinator, name, model, _filter))
+            sensors.append(
+                PhilipsFilterSensor(coordinator, name, model, device_id, _filter)
+            )
 
     async_add_entities(sensors, update_before_add=False)
 
@@ -76,33 +72,29 @@ class PhilipsSensor(PhilipsEntity, SensorEntity):
     """Define a Philips AirPurifier sensor."""
 
     def __init__(  # noqa: D107
-        self, coordinator: Coordinator, name: str, model: str, kind: str
+        self,
+        coordinator: Coordinator,
+        name: str,
+        model: str,
+        device_id: str,
+        kind: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id)
         self._model = model
         self._description = SENSOR_TYPES[kind]
-        self._icon_map = self._description.get(FanAttributes.ICON_MAP)
+        self._icon_map = self._description.icon_map
         self._norm_icon = (
-            next(iter(self._icon_map.items()))[1]
+            next(iter(self._icon_map.values()))
             if self._icon_map is not None
             else None
         )
-        self._attr_state_class = self._description.get(ATTR_STATE_CLASS)
-        self._attr_device_class = self._description.get(ATTR_DEVICE_CLASS)
-        self._attr_entity_category = self._description.get(CONF_ENTITY_CATEGORY)
-        self._attr_name = (
-            f"{name} {self._description[FanAttributes.LABEL].replace('_', ' ').title()}"
-        )
-        self._attr_native_unit_of_measurement = self._description.get(
-            FanAttributes.UNIT
-        )
+        self._attr_state_class = self._description.state_class
+        self._attr_device_class = self._description.device_class
+        self._attr_entity_category = self._description.entity_category
+        self._attr_name = f"{name} {self._description.label.replace('_', ' ').title()}"
+        self._attr_native_unit_of_measurement = self._description.unit
 
-        try:
-            device_id = self._device_status[PhilipsApi.DEVICE_ID]
-            self._attr_unique_id = f"{self._model}-{device_id}-{kind.lower()}"
-        except Exception as e:
-            _LOGGER.error("Failed retrieving unique_id: %s", e)
-            raise PlatformNotReady
+        self._attr_unique_id = f"{self._model}-{device_id}-{kind.lower()}"
         self._attrs: dict[str, Any] = {}
         self.kind = kind
 
@@ -110,7 +102,7 @@ class PhilipsSensor(PhilipsEntity, SensorEntity):
     def native_value(self) -> StateType:
         """Return the native value of the sensor."""
         value = self._device_status[self.kind]
-        convert = self._description.get(FanAttributes.VALUE)
+        convert = self._description.value
         if convert:
             value = convert(value, self._device_status)
         return cast(StateType, value)
@@ -133,39 +125,35 @@ class PhilipsFilterSensor(PhilipsEntity, SensorEntity):
     """Define a Philips AirPurifier filter sensor."""
 
     def __init__(  # noqa: D107
-        self, coordinator: Coordinator, name: str, model: str, kind: str
+        self,
+        coordinator: Coordinator,
+        name: str,
+        model: str,
+        device_id: str,
+        kind: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id)
         self._model = model
         self._description = FILTER_TYPES[kind]
-        self._icon_map = self._description[FanAttributes.ICON_MAP]
+        self._icon_map = self._description.icon_map
         self._norm_icon = (
-            next(iter(self._icon_map.items()))[1]
+            next(iter(self._icon_map.values()))
             if self._icon_map is not None
             else None
         )
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_name = (
-            f"{name} {self._description[FanAttributes.LABEL].replace('_', ' ').title()}"
-        )
+        self._attr_name = f"{name} {self._description.label.replace('_', ' ').title()}"
 
         self._value_key = kind
-        self._total_key = self._description[FanAttributes.TOTAL]
-        self._type_key = self._description[FanAttributes.TYPE]
+        self._total_key = self._description.total
+        self._type_key = self._description.type
 
         if self._has_total:
             self._attr_native_unit_of_measurement = PERCENTAGE
         else:
             self._attr_native_unit_of_measurement = UnitOfTime.HOURS
 
-        try:
-            device_id = self._device_status[PhilipsApi.DEVICE_ID]
-            self._attr_unique_id = (
-                f"{self._model}-{device_id}-{self._description[FanAttributes.LABEL]}"
-            )
-        except Exception as e:
-            _LOGGER.error("Failed retrieving unique_id: %s", e)
-            raise PlatformNotReady
+        self._attr_unique_id = f"{self._model}-{device_id}-{self._description.label}"
         self._attrs: dict[str, Any] = {}
 
     @property
@@ -197,7 +185,7 @@ class PhilipsFilterSensor(PhilipsEntity, SensorEntity):
 
     @property
     def _time_remaining(self) -> str:
-        return str(round(timedelta(hours=self._value) / timedelta(hours=1)))
+        return str(round(self._value))
 
     @property
     def _value(self) -> int:
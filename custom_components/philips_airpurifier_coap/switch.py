@@ -7,28 +7,22 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
-    ATTR_ICON,
-    CONF_ENTITY_CATEGORY,
-    CONF_HOST,
-    CONF_NAME,
-)
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.entity import Entity
 
 from .const import (
     CONF_MODEL,
     DATA_KEY_COORDINATOR,
     DOMAIN,
-    SWITCH_OFF,
-    SWITCH_ON,
     SWITCH_TYPES,
-    FanAttributes,
-    PhilipsApi,
 )
-from .philips import Coordinator, PhilipsEntity, model_to_class
+from .philips import (
+    Coordinator,
+    PhilipsEntity,
+    model_to_class,
+    resolve_device_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,27 +35,25 @@ async def async_setup_entry(
     """Set up platform for switch."""
     _LOGGER.debug("async_setup_entry called for platform switch")
 
-    host = entry.data[CONF_HOST]
     model = entry.data[CONF_MODEL]
     name = entry.data[CONF_NAME]
 
-    data = hass.data[DOMAIN][host]
+    data = hass.data[DOMAIN][entry.entry_id]
 
     coordinator = data[DATA_KEY_COORDINATOR]
+    device_id = resolve_device_id(entry.data, coordinator.status)
 
     model_class = model_to_class.get(model)
     if model_class:
-        available_switches = []
-
-        for cls in reversed(model_class.__mro__):
-            cls_available_switches = getattr(cls, "AVAILABLE_SWITCHES", [])
-            available_switches.extend(cls_available_switches)
+        available_switches = model_class._merged_switches
 
         switches = []
 
         for switch in SWITCH_TYPES:
             if switch in available_switches:
-                switches.append(PhilipsSwitch(coordinator, name, model, switch))
+                switches.append(
+                    PhilipsSwitch(coordinator, name, model, device_id, switch)
+                )
 
         async_add_entities(switches, update_before_add=False)
 
@@ -76,26 +68,23 @@ class PhilipsSwitch(PhilipsEntity, SwitchEntity):
     _attr_is_on: bool | None = False
 
     def __init__(  # noqa: D107
-        self, coordinator: Coordinator, name: str, model: str, switch: str
+        self,
+        coordinator: Coordinator,
+        name: str,
+        model: str,
+        device_id: str,
+        switch: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id)
         self._model = model
         self._description = SWITCH_TYPES[switch]
-        self._on = self._description.get(SWITCH_ON)
-        self._off = self._description.get(SWITCH_OFF)
-        self._attr_device_class = self._description.get(ATTR_DEVICE_CLASS)
-        self._attr_icon = self._description.get(ATTR_ICON)
-        self._attr_name = (
-            f"{name} {self._description[FanAttributes.LABEL].replace('_', ' ').title()}"
-        )
-        self._attr_entity_category = self._description.get(CONF_ENTITY_CATEGORY)
-
-        try:
-            device_id = self._device_status[PhilipsApi.DEVICE_ID]
-            self._attr_unique_id = f"{self._model}-{device_id}-{switch.lower()}"
-        except Exception as e:
-            _LOGGER.error("Failed retrieving unique_id: %s", e)
-            raise PlatformNotReady
+        self._on = self._description.switch_on
+        self._off = self._description.switch_off
+        self._attr_icon = self._description.icon
+        self._attr_name = f"{name} {self._description.label.replace('_', ' ').title()}"
+        self._attr_entity_category = self._description.entity_category
+
+        self._attr_unique_id = f"{self._model}-{device_id}-{switch.lower()}"
         self._attrs: dict[str, Any] = {}
         self.kind = switch
 
@@ -107,9 +96,9 @@ class PhilipsSwitch(PhilipsEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Switch the switch on."""
         _LOGGER.debug("async_turn_on, kind: %s - value: %s", self.kind, self._on)
-        await self.coordinator.client.set_control_value(self.kind, self._on)
+        await self.coordinator.async_set_control_value(self.kind, self._on)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Switch the switch off."""
         _LOGGER.debug("async_turn_off, kind: %s - value: %s", self.kind, self._off)
-        await self.coordinator.client.set_control_value(self.kind, self._off)
+        await self.coordinator.async_set_control_value(self.kind, self._off)
@@ -20,16 +20,21 @@ class Timer:
         self._timeout = timeout
         self._callback = callback
         self._task = None
+        self._deadline = 0.0
 
         if autostart:
             self.start()
 
     async def _job(self):
+        loop = asyncio.get_running_loop()
         while True:
             try:
                 self._in_callback = False
                 _LOGGER.debug("Starting Timer %ss", self._timeout)
-                await asyncio.sleep(self._timeout)
+                self._deadline = loop.time() + self._timeout
+                # touch() only moves the deadline, so keep sleeping until it has passed
+                while (remaining := self._deadline - loop.time()) > 0:
+                    await asyncio.sleep(remaining)
                 self._in_callback = True
                 _LOGGER.debug("Calling timeout callback")
                 await self._callback()
@@ -74,6 +79,13 @@ class Timer:
             self.cancel(msg="RESET")
         self.start()
 
+    def touch(self):
+        """Push the timeout back without restarting the task."""
+        if self._task is None:
+            self.start()
+            return
+        self._deadline = asyncio.get_running_loop().time() + self._timeout
+
     def start(self):
         """Start the task."""
         if self._task is None: